@@ -0,0 +1,318 @@
+# ==========================================
+# API SERVER KA-TIKA (ASYNCIO, JSON)
+# ==========================================
+# HTTP JSON service tanpa dependensi di luar stdlib (+ engine katika). Endpoint:
+#   GET /hari?tanggal=2026-10-18T05:30&lokasi=Denpasar   heartbeat + wewaran + wuku + sasih
+#   GET /rentang?start=2026-01-01&end=2026-12-31         kolom harian (maks MAX_RENTANG hari)
+#   GET /dewasa-ayu?kategori=...&start=...&days=365&n=10
+#   GET /odalan?start=...&end=...&lokasi=...  atau  /odalan?pura=Pura%20Besakih
+#   GET /weton?tanggal=2000-01-01
+#   GET /kueri?tri=Kajeng&panca=Kliwon&n=20  atau  /kueri?hari_raya=Tumpek&end=2036-12-31
+#   GET /health
+# Scan berat dijalankan di process pool, request identik yang sedang berjalan digabung
+# (coalescing), dan respons disimpan di cache LRU per tanggal lokal.
+#
+#   python api_server.py --port 8080 --workers 4
+import argparse
+import asyncio
+import json
+import os
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from urllib.parse import parse_qsl, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from katika import LOKASI_DEFAULT, get_modules, waktu_lokal
+
+MAX_RENTANG = 3660
+MAX_HEADER = 16384
+
+# Modul per proses (server utama dan tiap worker)
+_MODS = {}
+
+
+def _init_modules():
+    _MODS.update(get_modules())
+
+
+def _json_default(obj):
+    if isinstance(obj, (datetime, date, pd.Timestamp)):
+        return obj.isoformat()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Tidak bisa diserialisasi: {type(obj).__name__}")
+
+
+def _kolom(df: pd.DataFrame) -> dict:
+    # DataFrame -> {"kolom": [...]} (columnar, kategori jadi string)
+    out = {}
+    for col in df.columns:
+        s = df[col]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            out[col] = s.astype(str).tolist()
+        elif pd.api.types.is_datetime64_any_dtype(s.dtype):
+            out[col] = [x.isoformat() for x in s]
+        else:
+            out[col] = s.tolist()
+    return out
+
+
+def _tanggal(value: str, default: date = None) -> date:
+    if not value:
+        if default is None:
+            raise ValueError("parameter tanggal wajib diisi")
+        return default
+    return date.fromisoformat(value)
+
+
+def _today(lokasi) -> date:
+    return datetime.now(_MODS["pulse"].untuk(lokasi).timezone).date()
+
+
+# --- Handler (dipanggil di loop utama atau di worker process; hasil siap-JSON) ---
+def h_hari(q: dict) -> dict:
+    pulse = _MODS["pulse"].untuk(q.get("lokasi"))
+    raw = q.get("tanggal")
+    if not raw:
+        t = datetime.now(pulse.timezone)
+    else:
+        # Tanggal tanpa jam dianggap jam 12 siang (seperti scanner)
+        t = datetime.fromisoformat(raw)
+        if len(raw) == 10: t = t.replace(hour=12)
+    hb = pulse.get_heartbeat(t)
+    wew = _MODS["wew"].get_wewaran_lengkap(hb["signal"])
+    return {"waktu": t, "lokasi": pulse.location.name, "pulse": hb, "wewaran": wew,
+            "kalender": _MODS["cal"].get_calendar(hb["signal"], wew),
+            "sasih": _MODS["sas"].get_sasih_info(hb["signal"])}
+
+
+def h_weton(q: dict) -> dict:
+    return _MODS["otonan"].hitung(_tanggal(q.get("tanggal")), lokasi=q.get("lokasi"))
+
+
+def h_rentang(q: dict) -> dict:
+    start, end = _tanggal(q.get("start")), _tanggal(q.get("end"))
+    if not 0 <= (end - start).days < MAX_RENTANG:
+        raise ValueError(f"rentang harus 1..{MAX_RENTANG} hari")
+    batch = _MODS["batch"]
+    df = batch.get_range(start, end)
+    pulse = _MODS["pulse"].untuk(q.get("lokasi"))
+    sunrise, sunset = pulse.get_matahari_batch(df["signal"].to_numpy() + pulse.anchor_date.toordinal())
+    df["sunrise"] = waktu_lokal(sunrise, pulse.timezone)
+    df["sunset"] = waktu_lokal(sunset, pulse.timezone)
+    return {"lokasi": pulse.location.name, "jumlah": len(df), "kolom": _kolom(df)}
+
+
+def h_dewasa_ayu(q: dict) -> dict:
+    pad = _MODS["padewasan"]
+    kategori = q.get("kategori")
+    if kategori is not None and kategori not in pad.CATEGORIES:
+        raise ValueError(f"kategori tidak dikenal (pilih {pad.CATEGORIES})")
+    start = _tanggal(q.get("start"), _today(q.get("lokasi")) + timedelta(days=1))
+    if q.get("n"):
+        if kategori is None:
+            raise ValueError("parameter n butuh kategori")
+        n = int(q["n"])
+        if not 0 < n <= MAX_RENTANG:
+            raise ValueError(f"n harus 1..{MAX_RENTANG}")
+        return {"kategori": kategori, "hari": pad.cari_n_hari(kategori, n, start)}
+    days = int(q.get("days", 365))
+    if not 0 < days <= 36500:
+        raise ValueError("days harus 1..36500")
+    cats = pad.CATEGORIES if kategori is None else [kategori]
+    return {"start": start, "days": days, "hasil": {c: pad.cari_hari(c, start, days) for c in cats}}
+
+
+def h_odalan(q: dict) -> dict:
+    odalan = _MODS["odalan"]
+    if q.get("pura"):
+        start = _tanggal(q["start"]) if q.get("start") else None
+        return {"pura": q["pura"], "berikutnya": odalan.odalan_berikutnya(q["pura"], start, lokasi=q.get("lokasi"))}
+    start = _tanggal(q.get("start"), _today(q.get("lokasi")) + timedelta(days=1))
+    end = _tanggal(q.get("end"), start + timedelta(days=364))
+    if not 0 <= (end - start).days < 36500:
+        raise ValueError("rentang harus 1..36500 hari")
+    df = odalan.cari_rentang(start, end, lokasi=q.get("lokasi"))
+    return {"jumlah": len(df), "kolom": _kolom(df)}
+
+
+KUERI_PARAM = {"start", "end", "n", "lokasi", "hari_raya"}
+
+
+def h_kueri(q: dict) -> dict:
+    # Nilai field dipisah koma (OR), antar field AND
+    kueri = _MODS["kueri"]
+    asing = set(q) - KUERI_PARAM - set(kueri.MODULUS)
+    if asing:
+        raise ValueError(f"parameter tidak dikenal: {sorted(asing)} (field: {sorted(kueri.MODULUS)})")
+    if q.get("hari_raya"):
+        if q["hari_raya"] not in kueri.HARI_RAYA:
+            raise ValueError(f"hari_raya tidak dikenal (pilih {sorted(kueri.HARI_RAYA)})")
+        syarat = kueri.HARI_RAYA[q["hari_raya"]]
+    else:
+        syarat = {f: v.split(",") for f, v in q.items() if f in kueri.MODULUS}
+        for f in ("is_purnama", "is_tilem"):
+            if f in syarat:
+                syarat[f] = [v.lower() in ("1", "true") for v in syarat[f]]
+    start = _tanggal(q.get("start"), _today(q.get("lokasi")))
+    end = _tanggal(q["end"]) if q.get("end") else None
+    n = int(q["n"]) if q.get("n") else (None if end else 20)
+    if end is not None and not 0 <= (end - start).days < 36500:
+        raise ValueError("rentang harus 1..36500 hari")
+    if n is not None and not 0 <= n <= MAX_RENTANG:
+        raise ValueError(f"n harus 0..{MAX_RENTANG}")
+    if n is None:
+        # Jumlah hasil dihitung dulu dari aritmetika siklus (murah) sebelum sunrise per hasil
+        anchor = _MODS["pulse"].anchor_date
+        s0, s1 = (start - anchor).days, (end - anchor).days
+        if len(kueri.signals(syarat, s0, s1, MAX_RENTANG + 1)) > MAX_RENTANG:
+            raise ValueError(f"hasil lebih dari {MAX_RENTANG} hari; persempit rentang atau pakai n")
+    df = kueri.cari(syarat, n, start, end, lokasi=q.get("lokasi"))
+    return {"jumlah": len(df), "kolom": _kolom(df)}
+
+
+# path -> (handler, berat?)
+ROUTES = {
+    "/hari": (h_hari, False),
+    "/weton": (h_weton, False),
+    "/rentang": (h_rentang, True),
+    "/dewasa-ayu": (h_dewasa_ayu, True),
+    "/odalan": (h_odalan, True),
+    "/kueri": (h_kueri, True),
+}
+
+
+def _jalankan(path: str, q: dict) -> bytes:
+    # Dieksekusi di worker: hitung + serialisasi JSON sekaligus
+    return json.dumps(ROUTES[path][0](q), default=_json_default, ensure_ascii=False).encode()
+
+
+class KaTikaAPI:
+    def __init__(self, workers: int = None, cache_size: int = 1024):
+        _init_modules()
+        self.pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_modules) if workers != 0 else None
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+        self.inflight = {}
+        self.stats = {"requests": 0, "cache_hit": 0, "coalesced": 0, "computed": 0, "errors": 0}
+
+    def _key(self, path: str, q: dict) -> tuple:
+        # Tanggal lokal ikut kunci: respons dengan default "hari ini" otomatis kadaluarsa tiap hari
+        return (path, tuple(sorted(q.items())), _today(q.get("lokasi")).toordinal())
+
+    async def handle(self, path: str, q: dict) -> tuple:
+        if path == "/health":
+            return 200, json.dumps({"status": "ok", "stats": self.stats, "cache": len(self.cache)}).encode()
+        if path not in ROUTES:
+            return 404, json.dumps({"error": f"endpoint tidak dikenal: {path}"}).encode()
+        if path == "/hari" and not q.get("tanggal"):
+            # "sekarang" berubah tiap detik: jangan di-cache
+            return 200, _jalankan(path, q)
+
+        key = self._key(path, q)
+        body = self.cache.get(key)
+        if body is not None:
+            self.cache.move_to_end(key)
+            self.stats["cache_hit"] += 1
+            return 200, body
+        fut = self.inflight.get(key)
+        if fut is not None:
+            self.stats["coalesced"] += 1
+            return 200, await asyncio.shield(fut)
+
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self.inflight[key] = fut
+        try:
+            if ROUTES[path][1] and self.pool is not None:
+                body = await loop.run_in_executor(self.pool, _jalankan, path, q)
+            else:
+                body = _jalankan(path, q)
+            self.stats["computed"] += 1
+            self.cache[key] = body
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+            fut.set_result(body)
+            return 200, body
+        except BaseException as exc:
+            fut.set_exception(exc)
+            fut.exception()  # tandai sudah diambil bila tidak ada request yang menunggu
+            raise
+        finally:
+            del self.inflight[key]
+
+    async def client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        # HTTP/1.1 minimal dengan keep-alive; hanya GET
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                lines = head.decode("latin-1").split("\r\n")
+                method, target, version = (lines[0].split(" ") + ["", "", ""])[:3]
+                headers = {k.strip().lower(): v.strip() for k, _, v in (l.partition(":") for l in lines[1:] if l)}
+                keep_alive = (version == "HTTP/1.1" and headers.get("connection", "").lower() != "close")
+
+                self.stats["requests"] += 1
+                if method != "GET":
+                    status, body = 405, json.dumps({"error": "hanya GET"}).encode()
+                else:
+                    url = urlsplit(target)
+                    q = dict(parse_qsl(url.query))
+                    q.setdefault("lokasi", LOKASI_DEFAULT)
+                    try:
+                        status, body = await self.handle(url.path.rstrip("/") or "/", q)
+                    except (ValueError, KeyError, TypeError) as exc:
+                        self.stats["errors"] += 1
+                        status, body = 400, json.dumps({"error": str(exc)}, ensure_ascii=False).encode()
+                    except Exception as exc:
+                        self.stats["errors"] += 1
+                        status, body = 500, json.dumps({"error": repr(exc)}).encode()
+
+                reason = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}.get(status, "Error")
+                writer.write(
+                    f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(body)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                    .encode() + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    async def serve(self, host: str, port: int):
+        server = await asyncio.start_server(self.client, host, port, limit=MAX_HEADER)
+        print(f"Ka-Tika API di http://{host}:{port} (workers: {self.pool._max_workers if self.pool else 0})",
+              file=sys.stderr)
+        async with server:
+            await server.serve_forever()
+
+    def tutup(self):
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ka-Tika JSON API (asyncio)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="proses untuk scan berat (0 = inline)")
+    parser.add_argument("--cache-size", type=int, default=1024, help="jumlah respons di cache")
+    args = parser.parse_args(argv)
+
+    api = KaTikaAPI(args.workers, args.cache_size)
+    try:
+        asyncio.run(api.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        api.tutup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+# ==========================================
+# BENCHMARK KA-TIKA
+# ==========================================
+# Mengukur hot path tiap modul pada beberapa horizon (tahun) dan ukuran batch dengan jam
+# dibekukan, sehingga hasil antar run bisa dibandingkan. Hasil disimpan sebagai baseline
+# JSON; mode --check gagal (exit 1) bila ada kasus yang lebih lambat dari ambang batas atau
+# backend matahari NOAA menyimpang lebih dari NOAA_MAKS_SELISIH_DETIK dari astral.
+#
+#   python benchmarks/bench_katika.py                     # jalankan & tampilkan
+#   python benchmarks/bench_katika.py --update-baseline   # simpan baseline baru
+#   python benchmarks/bench_katika.py --check --threshold 0.25
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time as _time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from katika import KaTikaPulse, KaTikaSuryaCache, KaTikaWewaran, get_modules
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+HORIZONS = (1, 10, 100)
+BATCH_SIZES = (100, 1000, 10000)
+# Target cold start: proses baru, import katika + lookup dina pertama (tanpa pandas/astral)
+COLD_START_TARGET_MS = 200
+COLD_START_SCRIPT = (
+    "import time; t = time.perf_counter(); import katika; "
+    "katika.KaTikaWewaran().get_wewaran_lengkap(0); print(time.perf_counter() - t)"
+)
+# Batas selisih sunrise/sunset NOAA vs astral (1970-2069, sampel tiap NOAA_STEP hari)
+NOAA_MAKS_SELISIH_DETIK = 60
+NOAA_STEP = 7
+
+
+# Pengganti datetime di submodul katika selama benchmark: now() selalu FROZEN_NOW (WITA)
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return tz.localize(FROZEN_NOW) if tz is not None else FROZEN_NOW
+
+
+FROZEN_NOW = _FrozenDatetime(2026, 1, 1, 9, 0)
+
+
+def _modules():
+    return get_modules()
+
+
+# --- Kasus benchmark: setup(param) -> fungsi tanpa argumen yang diukur ---
+def _heartbeat(warm: bool):
+    def setup(years):
+        start = datetime(FROZEN_NOW.year, 1, 2, 12, 0)
+        times = [start + timedelta(days=i) for i in range(365 * years)]
+        cache = KaTikaSuryaCache(maxsize=len(times) + 1)
+        pulse = KaTikaPulse(sun_cache=cache)
+        if warm:
+            for t in times: pulse.get_heartbeat(t)
+
+        def run():
+            if not warm:
+                cache._lru.clear()
+            for t in times: pulse.get_heartbeat(t)
+        return run
+    return setup
+
+
+def _wewaran(years):
+    wew = KaTikaWewaran()
+    signals = range(2000, 2000 + 365 * years)
+    return lambda: [wew.get_wewaran_lengkap(s) for s in signals]
+
+
+def _batch(n):
+    mods = _modules()
+    return lambda: mods["batch"].get_batch(range(n))
+
+
+def _dewasa_ayu(years):
+    mods = _modules()
+    return lambda: mods["padewasan"].cari_dewasa_ayu(days=365 * years)
+
+
+def _scan_year(years):
+    mods = _modules()
+    if years == 1:
+        return lambda: mods["odalan"].scan_year(mods["wew"], mods["cal"], mods["sas"], mods["pulse"])
+    start = FROZEN_NOW.date() + timedelta(days=1)
+    return lambda: mods["odalan"].cari_rentang(start, start + timedelta(days=365 * years - 1))
+
+
+def _otonan(n):
+    mods = _modules()
+    births = [date(1950, 1, 1) + timedelta(days=i * 7) for i in range(n)]
+    return lambda: [mods["otonan"].hitung(b) for b in births]
+
+
+CASES = [
+    ("pulse.get_heartbeat[cold]", "tahun", HORIZONS, _heartbeat(warm=False)),
+    ("pulse.get_heartbeat[warm]", "tahun", HORIZONS, _heartbeat(warm=True)),
+    ("wewaran.get_wewaran_lengkap", "tahun", HORIZONS, _wewaran),
+    ("batch.get_batch", "hari", BATCH_SIZES, _batch),
+    ("padewasan.cari_dewasa_ayu", "tahun", HORIZONS, _dewasa_ayu),
+    ("odalan.scan_year", "tahun", HORIZONS, _scan_year),
+    ("otonan.hitung", "orang", BATCH_SIZES, _otonan),
+]
+
+
+def _submodul_datetime() -> list:
+    get_modules()  # pastikan semua submodul sudah dimuat
+    return [m for name, m in sys.modules.items()
+            if name.startswith("katika.") and getattr(m, "datetime", None) is datetime]
+
+
+def cold_start(repeat: int = 3) -> dict:
+    # Diukur di proses baru (modul belum ter-cache), dari dalam proses tsb
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    samples = [float(subprocess.check_output([sys.executable, "-c", COLD_START_SCRIPT], cwd=root))
+               for _ in range(repeat)]
+    key = "katika.cold_start"
+    status = "OK" if min(samples) * 1e3 <= COLD_START_TARGET_MS else "LEWAT TARGET"
+    print(f"{key:<45} min {min(samples) * 1e3:10.2f} ms   median {statistics.median(samples) * 1e3:10.2f} ms"
+          f"   (target {COLD_START_TARGET_MS} ms: {status})")
+    return {key: {"min": min(samples), "median": statistics.median(samples)}}
+
+
+def akurasi_noaa(step: int = NOAA_STEP) -> list:
+    # Kolom yang selisih maksimumnya melewati batas (kosong = lolos)
+    hasil = KaTikaPulse(backend="noaa").cek_akurasi_noaa(step=step)
+    print(f"{'surya.akurasi_noaa':<45} sunrise {hasil['max_selisih_sunrise_detik']:6.2f} s   "
+          f"sunset {hasil['max_selisih_sunset_detik']:6.2f} s   ({hasil['hari']} hari, "
+          f"batas {NOAA_MAKS_SELISIH_DETIK} s)")
+    return [(key, nilai) for key, nilai in hasil.items()
+            if key.startswith("max_selisih") and nilai > NOAA_MAKS_SELISIH_DETIK]
+
+
+def run_all(repeat: int = 3, horizons=HORIZONS, batch_sizes=BATCH_SIZES, only: str = None) -> dict:
+    results = {}
+    if not only or only in "katika.cold_start":
+        results.update(cold_start(repeat))
+    submodul = _submodul_datetime()
+    for m in submodul:
+        m.datetime = _FrozenDatetime
+    try:
+        for name, unit, params, setup in CASES:
+            if only and only not in name: continue
+            params = horizons if unit == "tahun" else batch_sizes
+            for p in params:
+                key = f"{name}@{p}{unit[0]}"
+                fn = setup(p)
+                samples = []
+                for _ in range(repeat):
+                    t0 = _time.perf_counter()
+                    fn()
+                    samples.append(_time.perf_counter() - t0)
+                results[key] = {"min": min(samples), "median": statistics.median(samples)}
+                print(f"{key:<45} min {min(samples) * 1e3:10.2f} ms   median {statistics.median(samples) * 1e3:10.2f} ms")
+    finally:
+        for m in submodul:
+            m.datetime = datetime
+    return results
+
+
+def load_baseline(path: str = BASELINE_PATH) -> dict:
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def save_baseline(results: dict, path: str = BASELINE_PATH):
+    meta = {"python": platform.python_version(), "platform": platform.platform(),
+            "frozen_now": FROZEN_NOW.isoformat(), "created": datetime.now().isoformat(timespec="seconds")}
+    with open(path, "w") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def check(results: dict, baseline: dict, threshold: float) -> list:
+    # Bandingkan waktu minimum; kasus tanpa baseline dilewati
+    regresi = []
+    for key, res in results.items():
+        if key not in baseline: continue
+        batas = baseline[key]["min"] * (1 + threshold)
+        if res["min"] > batas:
+            regresi.append((key, baseline[key]["min"], res["min"]))
+    return regresi
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark hot path Ka-Tika")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--horizons", type=int, nargs="+", default=list(HORIZONS), help="horizon dalam tahun")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=list(BATCH_SIZES))
+    parser.add_argument("-k", "--only", help="hanya kasus yang namanya mengandung teks ini")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="tulis hasil sebagai baseline baru")
+    parser.add_argument("--check", action="store_true",
+                        help="gagal bila lebih lambat dari baseline atau akurasi NOAA di luar batas")
+    parser.add_argument("--threshold", type=float, default=0.25, help="toleransi relatif (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    results = run_all(args.repeat, args.horizons, args.batch_sizes, args.only)
+    if args.update_baseline:
+        save_baseline(results, args.baseline)
+        print(f"Baseline disimpan ke {args.baseline}")
+    if args.check:
+        regresi = check(results, load_baseline(args.baseline), args.threshold)
+        for key, lama, baru in regresi:
+            print(f"REGRESI {key}: {lama * 1e3:.2f} ms -> {baru * 1e3:.2f} ms (+{(baru / lama - 1) * 100:.0f}%)")
+        menyimpang = akurasi_noaa()
+        for key, nilai in menyimpang:
+            print(f"AKURASI NOAA {key}: {nilai:.2f} s > {NOAA_MAKS_SELISIH_DETIK} s")
+        if regresi or menyimpang:
+            return 1
+        print(f"Tidak ada regresi (ambang {args.threshold:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,324 @@
+# ==========================================
+# CEK HASIL KA-TIKA (REGRESI)
+# ==========================================
+# Membandingkan hasil engine dengan referensi brute force per hari (rumus modulo asli untuk
+# tabel siklus, rantai if Wariga untuk padewasan, scan harian untuk kueri), supaya perubahan
+# tabel siklus, data aturan atau aritmetika kueri tidak diam-diam mengubah hasil.
+# Deterministik (seed tetap); gagal (exit 1) bila ada yang berbeda.
+#
+#   python benchmarks/cek_hasil.py
+#   python benchmarks/cek_hasil.py -k kueri
+import argparse
+import math
+import os
+import sys
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from katika import SIKLUS, KaTikaKueri, get_modules, indeks_nama
+
+SEED = 20200719
+MAKS_CONTOH = 5  # contoh selisih yang ditampilkan per cek
+
+
+def _modules():
+    return get_modules()
+
+
+def _beda(hasil: np.ndarray, ref: np.ndarray) -> str:
+    # Ringkasan selisih dua array (signal / tanggal): jumlah + posisi pertama yang berbeda
+    n = min(len(hasil), len(ref))
+    i = int(np.argmax(hasil[:n] != ref[:n])) if n and (hasil[:n] != ref[:n]).any() else n
+    pertama = f"{hasil[i] if i < len(hasil) else '-'} vs {ref[i] if i < len(ref) else '-'}"
+    return f"{len(hasil)} hasil, referensi {len(ref)}; beda pertama di #{i}: {pertama}"
+
+
+# --- Tabel siklus 2520 hari ---
+RENTANG_SIGNAL = range(-5000, 5001)
+
+
+def ref_hari(signal: int, wew, cal, sas) -> tuple:
+    # Rumus modulo per hari seperti sebelum tabel siklus (wewaran, wuku, sasih)
+    panca_idx, sapta_idx = signal % 5, signal % 7
+    total_urip = wew.URIP_SAPTA[sapta_idx] + wew.URIP_PANCA[panca_idx]
+    watak = wew.DATA_LINTANG.get((sapta_idx, panca_idx), wew.DEFAULT_WATAK)
+    w = {
+        "tri": wew.TRI_WARA[signal % 4], "catur": wew.CATUR_WARA[signal % 4],
+        "panca": wew.PANCA_WARA[panca_idx], "sad": wew.SAD_WARA[signal % 6],
+        "sapta": wew.SAPTA_WARA[sapta_idx], "asta": wew.ASTA_WARA[signal % 8],
+        "sanga": wew.SANGA_WARA[signal % 9], "dasa": wew.DASA_WARA[(total_urip + 1) % 10],
+        "total_urip": total_urip, "lintang_nama": watak["nama"], "lintang_sifat": watak["sifat"],
+    }
+    wuku_idx = (signal // 7) % 30
+    c = {
+        "wuku_name": cal.WUKU[wuku_idx], "wuku_index": wuku_idx, "ingkel_name": cal.INGKEL[wuku_idx % 6],
+        "full_label": f"{w['sapta']} {w['panca']} {cal.WUKU[wuku_idx]}",
+    }
+    cycle_pos = signal % 420
+    sasih_idx, day_sasih = cycle_pos // 35, cycle_pos % 35 + 1
+    purnama, tilem = (day_sasih == 18, day_sasih in (1, 35))
+    if sasih_idx % 2:  # index ganjil: pola terang
+        purnama, tilem = tilem, purnama
+    if purnama: status = "PURNAMA"
+    elif tilem: status = "TILEM"
+    elif (1 < day_sasih < 18) == (sasih_idx % 2 == 0): status = "PENANGGAL"
+    else: status = "PANGLONG"
+    s = {"sasih_name": sas.SASIH[sasih_idx], "status_bulan": status, "is_purnama": purnama, "is_tilem": tilem}
+    return w, c, s
+
+
+def cek_siklus_per_hari() -> list:
+    # get_wewaran_lengkap / get_calendar / get_sasih_info vs rumus modulo
+    m = _modules()
+    wew, cal, sas = m["wew"], m["cal"], m["sas"]
+    selisih = []
+    for signal in RENTANG_SIGNAL:
+        w, c, s = ref_hari(signal, wew, cal, sas)
+        hasil = wew.get_wewaran_lengkap(signal)
+        for nama, dapat, ref in (("wewaran", hasil, w), ("calendar", cal.get_calendar(signal, hasil), c),
+                                 ("sasih", sas.get_sasih_info(signal), s)):
+            if dapat != ref:
+                beda = {k: (dapat.get(k), v) for k, v in ref.items() if dapat.get(k) != v}
+                selisih.append(f"{nama}({signal}): {beda} (dapat, referensi)")
+    return selisih
+
+
+def cek_siklus_batch() -> list:
+    # KaTikaBatch.get_batch (vektor, kategori) vs rumus modulo
+    m = _modules()
+    wew, cal, sas = m["wew"], m["cal"], m["sas"]
+    df = m["batch"].get_batch(np.asarray(RENTANG_SIGNAL))
+    kolom = {"tri": ("w", "tri"), "catur": ("w", "catur"), "panca": ("w", "panca"), "sad": ("w", "sad"),
+             "sapta": ("w", "sapta"), "asta": ("w", "asta"), "sanga": ("w", "sanga"), "dasa": ("w", "dasa"),
+             "total_urip": ("w", "total_urip"), "wuku": ("c", "wuku_name"), "wuku_index": ("c", "wuku_index"),
+             "ingkel": ("c", "ingkel_name"), "sasih": ("s", "sasih_name"), "status_bulan": ("s", "status_bulan"),
+             "is_purnama": ("s", "is_purnama"), "is_tilem": ("s", "is_tilem")}
+    ref = [dict(zip("wcs", ref_hari(signal, wew, cal, sas))) for signal in RENTANG_SIGNAL]
+    selisih = []
+    for col, (bagian, key) in kolom.items():
+        dapat = df[col].tolist()
+        for signal, d, r in zip(RENTANG_SIGNAL, dapat, ref):
+            if d != r[bagian][key]:
+                selisih.append(f"get_batch[{col}] signal {signal}: {d!r}, referensi {r[bagian][key]!r}")
+                break
+    return selisih
+
+
+# --- Padewasan (aturan Wariga) ---
+ANCHOR = date(2020, 7, 19)
+START_DEWASA = date(2026, 1, 2)
+
+
+def ref_dewasa(w: dict, c: dict, s: dict) -> list:
+    # Rantai if Wariga per hari seperti sebelum aturan dikompilasi ke mask (urutan = kategori)
+    sapta, panca, tri = w["sapta"], w["panca"], w["tri"]
+    wuku_idx, ingkel = c["wuku_index"], c["ingkel_name"]
+    uncal = 10 <= wuku_idx <= 15
+    rangda = wuku_idx in (6, 7, 14, 15, 22, 23)
+    kala = sapta == "Saniscara" and panca == "Paing"
+    return [
+        not uncal and not rangda and not kala and ingkel != "Wong"
+        and sapta in ("Wraspati", "Sukra") and panca in ("Umanis", "Kliwon"),
+        not kala and ingkel != "Taru" and (sapta == "Saniscara" or (sapta == "Wraspati" and panca == "Pon")),
+        not kala and ingkel not in ("Taru", "Buku") and sapta in ("Soma", "Wraspati", "Sukra"),
+        not kala and ingkel not in ("Sato", "Mina") and (sapta in ("Wraspati", "Saniscara") or c["wuku_name"] == "Uye"),
+        not kala and ingkel != "Buku" and (sapta == "Anggara" or tri == "Pasah"),
+        not kala and tri == "Pasah",
+        not kala and ingkel != "Mina" and (tri == "Pasah" or sapta == "Soma"),
+        not uncal and not kala and (s["is_purnama"] or s["is_tilem"] or (tri == "Kajeng" and panca == "Kliwon")),
+    ]
+
+
+def _ref_hari_baik(start: date, days: int) -> dict:
+    # {kategori: [tanggal]} dari rantai if, dina dievaluasi jam 12 siang (signal = selisih hari)
+    m = _modules()
+    pad = m["padewasan"]
+    hasil = {cat: [] for cat in pad.CATEGORIES}
+    for i in range(days):
+        tanggal = start + timedelta(days=i)
+        ok = ref_dewasa(*ref_hari((tanggal - ANCHOR).days, m["wew"], m["cal"], m["sas"]))
+        for cat, cocok in zip(pad.CATEGORIES, ok):
+            if cocok: hasil[cat].append(tanggal)
+    return hasil
+
+
+def cek_padewasan_cari_hari() -> list:
+    # cari_hari per kategori atas seluruh RENTANG_SIGNAL + cari_dewasa_ayu 365 hari
+    pad = _modules()["padewasan"]
+    if len(pad.CATEGORIES) != 8:
+        return [f"kategori berubah: {pad.CATEGORIES}"]
+    start = ANCHOR + timedelta(days=RENTANG_SIGNAL.start)
+    ref = _ref_hari_baik(start, len(RENTANG_SIGNAL))
+    selisih = []
+    for cat in pad.CATEGORIES:
+        dapat = pad.cari_hari(cat, start, len(RENTANG_SIGNAL))
+        if dapat != ref[cat]:
+            beda = _beda(np.array(dapat, dtype=object), np.array(ref[cat], dtype=object))
+            selisih.append(f"cari_hari({cat!r}): {beda}")
+    ref = _ref_hari_baik(START_DEWASA, 365)
+    ref = [{"kategori": k, "Tanggal masehi": pad._format_date_ranges(v), "jumlah_hari": len(v)}
+           for k, v in ref.items() if v]
+    if pad.cari_dewasa_ayu(start_date=START_DEWASA) != ref:
+        selisih.append(f"cari_dewasa_ayu(start_date={START_DEWASA}) berbeda dari scan 365 hari")
+    return selisih
+
+
+def cek_padewasan_cari_n_hari() -> list:
+    # cari_n_hari = n hari pertama dari scan harian, juga bila n melewati blok 2520 hari
+    pad = _modules()["padewasan"]
+    ref = _ref_hari_baik(START_DEWASA, 3 * SIKLUS.PERIODE)
+    selisih = []
+    for cat in pad.CATEGORIES:
+        for n in (1, 10, len([t for t in ref[cat] if t < START_DEWASA + timedelta(days=SIKLUS.PERIODE)]) + 5):
+            dapat = pad.cari_n_hari(cat, n, START_DEWASA)
+            if dapat != ref[cat][:n]:
+                beda = _beda(np.array(dapat, dtype=object), np.array(ref[cat][:n], dtype=object))
+                selisih.append(f"cari_n_hari({cat!r}, {n}): {beda}")
+    return selisih
+
+
+# --- Otonan batch ---
+def cek_otonan_batch() -> list:
+    # hitung_batch baris demi baris vs hitung() per orang (hari ini sama untuk keduanya)
+    otonan = _modules()["otonan"]
+    rng = np.random.default_rng(SEED + 3)
+    lahir = [date(1900, 1, 1) + timedelta(days=int(d)) for d in rng.integers(0, 200 * 365, size=300)]
+    for _ in range(2):  # diulang bila tengah malam lewat saat cek berjalan
+        today = datetime.now(otonan.astro.timezone).date()
+        df = otonan.hitung_batch(lahir, today=today)
+        refs = [otonan.hitung(tgl) for tgl in lahir]
+        if datetime.now(otonan.astro.timezone).date() == today: break
+    selisih = []
+    for i, (tgl, ref) in enumerate(zip(lahir, refs)):
+        row = df.iloc[i]
+        dapat = {"weton_text": row["weton_text"], "urip_total": int(row["urip_total"]),
+                 "hasil_analisa": {"bintang": row["lintang_nama"], "watak": row["lintang_sifat"]},
+                 "next_otonan_date": row["next_otonan_date"].date(), "sisa_hari": int(row["sisa_hari"])}
+        if dapat != ref:
+            beda = {k: (dapat[k], v) for k, v in ref.items() if dapat[k] != v}
+            selisih.append(f"hitung_batch baris {i} ({tgl}): {beda} (dapat, referensi)")
+    return selisih
+
+
+# --- Kueri siklus (CRT) ---
+def _cocok(tabel: dict, syarat: dict, signals: np.ndarray) -> np.ndarray:
+    # Referensi: evaluasi tiap hari langsung di tabel 2520 hari (tanpa MODULUS / CRT)
+    idx = SIKLUS.gather(signals)
+    mask = np.ones(len(signals), dtype=bool)
+    for field, values in syarat.items():
+        values = values if isinstance(values, list) else [values]
+        kode = indeks_nama(tabel, field, values) if field in tabel else [int(v) for v in values]
+        mask &= np.isin(idx[field], kode)
+    return mask
+
+
+def _syarat_acak(rng, tabel: dict) -> dict:
+    fields = rng.choice(sorted(KaTikaKueri.MODULUS), size=rng.integers(1, 4), replace=False)
+    syarat = {}
+    for field in fields.tolist():
+        if field in tabel:
+            names = list(dict.fromkeys(tabel[field]))
+            syarat[field] = rng.choice(names, size=rng.integers(1, min(3, len(names)) + 1), replace=False).tolist()
+        elif field in ("is_purnama", "is_tilem"):
+            syarat[field] = True
+        else:
+            kode = np.unique(SIKLUS.arrays[field][:KaTikaKueri.MODULUS[field]])
+            syarat[field] = rng.choice(kode, size=rng.integers(1, 3), replace=False).tolist()
+    return syarat
+
+
+def cek_kueri_gabung() -> list:
+    # _gabung untuk pasangan modulus koprima dan tidak koprima vs himpunan residu brute force
+    rng = np.random.default_rng(SEED)
+    pasangan = [(4, 5), (4, 6), (6, 8), (8, 9), (35, 42), (42, 70), (70, 210), (210, 420), (4, 35), (9, 420)]
+    selisih = []
+    for m1, m2 in pasangan:
+        for _ in range(20):
+            r1 = np.sort(rng.choice(m1, size=rng.integers(1, m1 + 1), replace=False))
+            r2 = np.sort(rng.choice(m2, size=rng.integers(1, m2 + 1), replace=False))
+            kpk, hasil = KaTikaKueri._gabung(m1, r1, m2, r2)
+            x = np.arange(m1 * m2 // math.gcd(m1, m2))
+            ref = x[np.isin(x % m1, r1) & np.isin(x % m2, r2)]
+            if kpk != len(x) or not np.array_equal(hasil, ref):
+                selisih.append(f"_gabung({m1}, {r1.tolist()}, {m2}, {r2.tolist()}) -> {kpk}, {hasil.tolist()}")
+    return selisih
+
+
+def cek_kueri_rentang() -> list:
+    # signals(s0, s1) untuk syarat acak vs scan harian
+    kueri = _modules()["kueri"]
+    rng = np.random.default_rng(SEED + 1)
+    selisih = []
+    for _ in range(300):
+        syarat = _syarat_acak(rng, kueri._tabel)
+        s0 = int(rng.integers(-5000, 5000))
+        s1 = s0 + int(rng.integers(0, 3000))
+        sig = np.arange(s0, s1 + 1)
+        ref = sig[_cocok(kueri._tabel, syarat, sig)]
+        hasil = kueri.signals(syarat, s0, s1)
+        if not np.array_equal(hasil, ref):
+            selisih.append(f"signals({syarat}, {s0}, {s1}): {_beda(hasil, ref)}")
+    return selisih
+
+
+def cek_kueri_n() -> list:
+    # signals(s0, n=...) = n kemunculan pertama dari scan harian, juga bila n melewati satu periode
+    kueri = _modules()["kueri"]
+    rng = np.random.default_rng(SEED + 2)
+    daftar = [dict(v) for v in KaTikaKueri.HARI_RAYA.values()]
+    daftar += [_syarat_acak(rng, kueri._tabel) for _ in range(200)]
+    selisih = []
+    for syarat in daftar:
+        s0 = int(rng.integers(-5000, 5000))
+        n = int(rng.choice([1, 2, 7, 50, 400]))
+        per_siklus = int(_cocok(kueri._tabel, syarat, np.arange(SIKLUS.PERIODE)).sum())
+        panjang = SIKLUS.PERIODE * (n // max(per_siklus, 1) + 2)
+        sig = np.arange(s0, s0 + panjang)
+        ref = sig[_cocok(kueri._tabel, syarat, sig)][:n]
+        hasil = kueri.signals(syarat, s0, n=n)
+        if not np.array_equal(hasil, ref):
+            selisih.append(f"signals({syarat}, {s0}, n={n}): {_beda(hasil, ref)}")
+        # n dan s1 bersamaan: yang lebih dulu membatasi
+        s1 = s0 + int(rng.integers(0, 1000))
+        ref = ref[ref <= s1]
+        hasil = kueri.signals(syarat, s0, s1, n)
+        if not np.array_equal(hasil, ref):
+            selisih.append(f"signals({syarat}, {s0}, {s1}, n={n}): {_beda(hasil, ref)}")
+    if len(kueri.signals({"sapta": "Soma"}, 0, n=0)) or len(kueri.signals({"sapta": "Soma"}, 10, 5)):
+        selisih.append("n=0 / s1 < s0 harus kosong")
+    return selisih
+
+
+CEK = [
+    ("siklus.per_hari", cek_siklus_per_hari),
+    ("siklus.batch", cek_siklus_batch),
+    ("padewasan.cari_hari", cek_padewasan_cari_hari),
+    ("padewasan.cari_n_hari", cek_padewasan_cari_n_hari),
+    ("otonan.batch", cek_otonan_batch),
+    ("kueri.gabung", cek_kueri_gabung),
+    ("kueri.signals_rentang", cek_kueri_rentang),
+    ("kueri.signals_n", cek_kueri_n),
+]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cek hasil engine Ka-Tika terhadap referensi brute force")
+    parser.add_argument("-k", "--only", help="hanya cek yang namanya mengandung teks ini")
+    args = parser.parse_args(argv)
+
+    gagal = 0
+    for name, fn in CEK:
+        if args.only and args.only not in name: continue
+        selisih = fn()
+        print(f"{name:<45} {'OK' if not selisih else f'GAGAL ({len(selisih)} selisih)'}")
+        for baris in selisih[:MAKS_CONTOH]:
+            print(f"    {baris}")
+        gagal += bool(selisih)
+    return 1 if gagal else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+# ==========================================
+# EKSPOR KALENDER KA-TIKA (CLI)
+# ==========================================
+# Ekspor kalender lengkap (wewaran, wuku, sasih, sunrise/sunset, dewasa ayu, odalan)
+# ke CSV / Parquet / iCalendar. Rentang dipecah per blok dan dihitung paralel di
+# process pool; hasil ditulis bertahap sesuai urutan tanggal.
+#
+#   python export_kalender.py 2000-01-01 2099-12-31 -f csv -o kalender.csv
+#   python export_kalender.py 2000-01-01 2099-12-31 -f parquet -o kalender.parquet -j 8
+#   python export_kalender.py 2026-01-01 2026-12-31 -f ics -o kalender.ics
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+from katika import KaTikaPulse, ATURAN_WARIGA, LOKASI, LOKASI_DEFAULT, get_modules, waktu_lokal
+
+FORMATS = ("csv", "parquet", "ics")
+
+# Modul per proses worker (dibuat sekali oleh initializer)
+_MODS = {}
+
+
+def _init_worker(backend: str, lokasi: str = None):
+    _MODS.update(get_modules(backend, lokasi))
+
+
+def hitung_blok(blok: tuple) -> pd.DataFrame:
+    # blok = (tanggal awal, tanggal akhir) inklusif
+    start, end = blok
+    pulse, pad, odalan, batch = _MODS["pulse"], _MODS["padewasan"], _MODS["odalan"], _MODS["batch"]
+    signals = batch.signals_for_range(start, end)
+    df = batch.get_batch(signals)
+    df.insert(0, "tanggal", (np.datetime64(start, "D") + np.arange(len(signals))).astype(object))
+
+    sunrise, sunset = pulse.get_matahari_batch(signals + pulse.anchor_date.toordinal())
+    df["sunrise"] = waktu_lokal(sunrise, pulse.timezone)
+    df["sunset"] = waktu_lokal(sunset, pulse.timezone)
+
+    bits = pad.bitmask[signals % len(pad.bitmask)]
+    for bit, cat in enumerate(pad.CATEGORIES):
+        df[cat] = ((bits >> bit) & 1).astype(bool)
+
+    sig, pid, _ = odalan.cari_signal(int(signals[0]), int(signals[-1]))
+    nama = pd.Series(np.asarray(odalan.pura, dtype=object)[pid], index=sig)
+    per_hari = nama.groupby(level=0).agg("; ".join)
+    df["odalan"] = per_hari.reindex(signals).fillna("").to_numpy()
+    return df
+
+
+def bagi_rentang(start: date, end: date, chunk_days: int) -> list:
+    if chunk_days < 1:
+        raise ValueError(f"chunk_days harus >= 1 (diberikan {chunk_days})")
+    blok, curr = [], start
+    while curr <= end:
+        akhir = min(end, curr + timedelta(days=chunk_days - 1))
+        blok.append((curr, akhir))
+        curr = akhir + timedelta(days=1)
+    return blok
+
+
+# --- Penulis bertahap per format ---
+class PenulisCSV:
+    def __init__(self, path):
+        self.f = open(path, "w", newline="", encoding="utf-8")
+        self.header = True
+
+    def tulis(self, df):
+        df.to_csv(self.f, header=self.header, index=False)
+        self.header = False
+
+    def tutup(self):
+        self.f.close()
+
+
+class PenulisParquet:
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            sys.exit("Format parquet butuh paket 'pyarrow' (pip install pyarrow)")
+        self.pa, self.pq, self.path = pa, pq, path
+        self.writer = None
+
+    def tulis(self, df):
+        df = df.assign(tanggal=pd.to_datetime(df["tanggal"]))
+        if self.writer is None:
+            table = self.pa.Table.from_pandas(df, preserve_index=False)
+            self.writer = self.pq.ParquetWriter(self.path, table.schema)
+        else:
+            table = self.pa.Table.from_pandas(df, schema=self.writer.schema, preserve_index=False)
+        self.writer.write_table(table)
+
+    def tutup(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+class PenulisICS:
+    # iCalendar (RFC 5545): satu event sehari penuh per hari, baris CRLF dilipat di 75 oktet
+    def __init__(self, path):
+        self.f = open(path, "w", newline="", encoding="utf-8")
+        self._baris("BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Ka-Tika//Kalender Tika//ID",
+                    "CALSCALE:GREGORIAN", "X-WR-CALNAME:Kalender Ka-Tika")
+        self.stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+    @staticmethod
+    def _escape(text: str) -> str:
+        return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+    @staticmethod
+    def _lipat(line: str) -> str:
+        data, out = line.encode("utf-8"), []
+        while len(data) > 75:
+            cut = 75 if not out else 74
+            while cut and (data[cut] & 0xC0) == 0x80:  # jangan potong di tengah karakter UTF-8
+                cut -= 1
+            out.append(data[:cut].decode("utf-8"))
+            data = data[cut:]
+        out.append(data.decode("utf-8"))
+        return "\r\n ".join(out)
+
+    @staticmethod
+    def _tanggal(hari: date) -> str:
+        # Bukan strftime("%Y%m%d"): glibc tidak mengisi nol tahun < 1000 (DATE harus 8 digit)
+        return f"{hari.year:04d}{hari.month:02d}{hari.day:02d}"
+
+    def _baris(self, *lines):
+        self.f.write("".join(self._lipat(line) + "\r\n" for line in lines))
+
+    def tulis(self, df):
+        cats = [c for c in ATURAN_WARIGA if c in df.columns]
+        for row in df.itertuples(index=False):
+            r = dict(zip(df.columns, row))
+            hari = r["tanggal"]
+            dewasa = [c for c in cats if r[c]]
+            desc = [
+                f"Tri: {r['tri']}, Sad: {r['sad']}, Asta: {r['asta']}, Sanga: {r['sanga']}, Dasa: {r['dasa']}",
+                f"Urip: {r['total_urip']}, Ingkel: {r['ingkel']}",
+                f"Sasih {r['sasih']} - {r['status_bulan']}",
+                f"Surya: {r['sunrise']:%H:%M} - {r['sunset']:%H:%M}",
+            ]
+            if dewasa: desc.append("Dewasa Ayu: " + ", ".join(dewasa))
+            if r["odalan"]: desc.append("Odalan: " + r["odalan"])
+            self._baris(
+                "BEGIN:VEVENT",
+                f"UID:katika-{self._tanggal(hari)}@ka-tika",
+                f"DTSTAMP:{self.stamp}",
+                f"DTSTART;VALUE=DATE:{self._tanggal(hari)}",
+                f"DTEND;VALUE=DATE:{self._tanggal(hari + timedelta(days=1))}",
+                "SUMMARY:" + self._escape(f"{r['sapta']} {r['panca']} {r['wuku']}"),
+                "DESCRIPTION:" + self._escape("\n".join(desc)),
+                "TRANSP:TRANSPARENT",
+                "END:VEVENT",
+            )
+
+    def tutup(self):
+        self._baris("END:VCALENDAR")
+        self.f.close()
+
+
+PENULIS = {"csv": PenulisCSV, "parquet": PenulisParquet, "ics": PenulisICS}
+
+
+def ekspor(start: date, end: date, fmt: str, out: str, workers: int = None,
+           chunk_days: int = 3650, backend: str = "noaa", verbose: bool = False, lokasi: str = None) -> int:
+    blok = bagi_rentang(start, end, chunk_days)
+    penulis = PENULIS[fmt](out)
+    total, pool = 0, None
+    try:
+        if workers == 1:
+            _init_worker(backend, lokasi)
+            hasil = map(hitung_blok, blok)
+        else:
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(backend, lokasi))
+            hasil = pool.map(hitung_blok, blok)
+        # map() menjaga urutan blok, jadi file ditulis berurutan tanpa menahan semua hasil
+        for (a, b), df in zip(blok, hasil):
+            penulis.tulis(df)
+            total += len(df)
+            if verbose:
+                print(f"{a} s/d {b}: {len(df)} hari", file=sys.stderr)
+    finally:
+        # Juga saat penulis gagal: hentikan worker dan batalkan blok yang belum jalan
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        penulis.tutup()
+    return total
+
+
+def _bilangan_positif(text: str) -> int:
+    n = int(text)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"harus >= 1 (diberikan {n})")
+    return n
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ekspor kalender Ka-Tika ke CSV / Parquet / iCalendar")
+    parser.add_argument("start", type=date.fromisoformat, help="tanggal awal (YYYY-MM-DD)")
+    parser.add_argument("end", type=date.fromisoformat, help="tanggal akhir, inklusif (YYYY-MM-DD)")
+    parser.add_argument("-f", "--format", choices=FORMATS, default="csv")
+    parser.add_argument("-o", "--output", required=True, help="file tujuan")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(), help="jumlah proses (1 = tanpa pool)")
+    parser.add_argument("--chunk-days", type=_bilangan_positif, default=3650, help="jumlah hari per blok")
+    parser.add_argument("--backend", choices=KaTikaPulse.BACKENDS, default="noaa", help="backend sunrise/sunset")
+    parser.add_argument("--lokasi", choices=sorted(LOKASI), default=LOKASI_DEFAULT, help="lokasi sunrise/sunset")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args(argv)
+    if args.end < args.start:
+        parser.error("tanggal akhir sebelum tanggal awal")
+
+    t0 = datetime.now()
+    n = ekspor(args.start, args.end, args.format, args.output, args.workers,
+               args.chunk_days, args.backend, args.verbose, args.lokasi)
+    print(f"{n} hari ditulis ke {args.output} dalam {(datetime.now() - t0).total_seconds():.1f} detik", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# ==========================================
+# KA-TIKA ENGINE
+# ==========================================
+# Engine kalender Bali tanpa Streamlit. Submodul dimuat saat nama pertama kali dipakai
+# (`from katika import KaTikaWewaran` hanya memuat siklus + wewaran); pandas dan astral
+# baru di-import oleh fungsi yang membutuhkannya.
+#
+#   profiler   KaTikaProfiler, PROFILER, diukur
+#   siklus     tabel siklus 2520 hari (SIKLUS)
+#   surya      pulse, cache & backend matahari, registry lokasi
+#   wewaran    wewaran, wuku, sasih + peta nama
+#   padewasan  rule engine dewasa ayu
+#   odalan     database & scanner odalan
+#   otonan     weton / otonan (tunggal dan batch)
+#   batch      evaluasi vektor per rentang tanggal
+#   jendela    sliding window 365 hari
+#   kueri      kueri siklus "N kali berikutnya"
+#   arsip      tabel hari biner memory-mapped (tahun 2 M s/d 2199)
+#   modul      objek modul bersama (sekali per proses)
+import importlib
+
+_EKSPOR = {
+    "profiler": ["KaTikaProfiler", "PROFILER", "diukur"],
+    "siklus": ["HariSiklus", "KaTikaSiklus", "SIKLUS"],
+    "surya": ["KaTikaSuryaCache", "SURYA_CACHE", "KaTikaSuryaNOAA", "Lokasi", "LOKASI", "LOKASI_DEFAULT",
+              "daftar_lokasi", "get_lokasi", "waktu_lokal", "KaTikaPulse"],
+    "wewaran": ["KaTikaWewaran", "KaTikaCalendar", "KaTikaSasih", "tabel_nama", "indeks_nama"],
+    "padewasan": ["EKSKLUSI_WARIGA", "ATURAN_WARIGA", "KaTikaPadewasan"],
+    "odalan": ["KaTikaOdalan"],
+    "otonan": ["KaTikaOtonan"],
+    "batch": ["HariKaTika", "KaTikaBatch"],
+    "jendela": ["KaTikaJendela"],
+    "kueri": ["KaTikaKueri"],
+    "arsip": ["KaTikaArsip"],
+    "modul": ["bangun_modules", "get_modules"],
+}
+_ASAL = {nama: modul for modul, names in _EKSPOR.items() for nama in names}
+
+__all__ = list(_ASAL)
+
+
+def __getattr__(name):
+    modul = _ASAL.get(name)
+    if modul is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{modul}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_ASAL))
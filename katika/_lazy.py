@@ -0,0 +1,20 @@
+# Modul berat (pandas) baru di-import saat atribut pertamanya dipakai, sehingga
+# `import katika` dan lookup per hari tidak ikut memuat pandas.
+import importlib
+
+
+class _ModulMalas:
+    def __init__(self, nama: str):
+        self._nama = nama
+        self._modul = None
+
+    def __getattr__(self, attr):
+        if self._modul is None:
+            self._modul = importlib.import_module(self._nama)
+        # Simpan di instance: akses berikutnya tidak lewat __getattr__ lagi
+        value = getattr(self._modul, attr)
+        setattr(self, attr, value)
+        return value
+
+
+pd = _ModulMalas("pandas")
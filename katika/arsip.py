@@ -0,0 +1,187 @@
+# ==========================================
+# 11. MODUL ARSIP (TAHUN 2 M S/D ABAD MENDATANG)
+# ==========================================
+# Tabel hari biner ringkas untuk rentang panjang (default 1 Jan 2 M s/d 31 Des 2199,
+# ~803 ribu hari, kalender Gregorian proleptik). Satu record 20 byte per hari:
+#   signal   int32   hari sejak anchor (negatif sebelum 19 Juli 2020)
+#   wewaran  uint64  indeks field siklus dipak per bit (lihat KaTikaArsip.BIT)
+#   sunrise  int32   detik sejak 00:00 UTC tanggal tsb (backend NOAA)
+#   sunset   int32
+# Disimpan sebagai .npy (memory-mapped) + metadata .json, dibangun sekali per lokasi dengan
+# KaTikaArsip.bangun(). Lookup per tanggal dan statistik seluruh rentang membaca file per
+# blok, tanpa memuat atau menghitung ulang semuanya.
+import json
+from datetime import datetime, date
+import pytz
+import numpy as np
+from .siklus import SIKLUS, KaTikaSiklus
+from .surya import KaTikaPulse, KaTikaSuryaCache
+from .wewaran import KaTikaWewaran, KaTikaCalendar, KaTikaSasih, tabel_nama
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class KaTikaArsip:
+    DTYPE = np.dtype([("signal", "<i4"), ("wewaran", "<u8"), ("sunrise", "<i4"), ("sunset", "<i4")])
+    # (field, jumlah bit), mulai dari bit terendah
+    BIT = [("tri", 2), ("catur", 2), ("panca", 3), ("sad", 3), ("sapta", 3), ("asta", 3), ("sanga", 4),
+           ("dasa", 4), ("wuku", 5), ("ingkel", 3), ("sasih", 4), ("status_bulan", 2)]
+    KOSONG = np.iinfo(np.int32).min  # matahari tidak terbit/terbenam (lintang kutub)
+    AWAL, AKHIR = date(2, 1, 1), date(2199, 12, 31)
+    BLOK = SIKLUS.PERIODE * 40  # hari per blok saat membangun / menghitung statistik
+    VERSI = 1
+
+    def __init__(self, path: str, wew=None, cal=None, sas=None):
+        with open(path + ".json") as f:
+            self.meta = json.load(f)
+        if self.meta.get("versi") != self.VERSI or self.meta.get("bit") != [list(b) for b in self.BIT]:
+            raise ValueError(f"Format arsip tidak dikenal: {path!r} (bangun ulang dengan KaTikaArsip.bangun)")
+        self.path = path
+        self.data = np.load(path, mmap_mode="r")
+        self.start = date.fromisoformat(self.meta["start"])
+        self.end = date.fromordinal(self.start.toordinal() + len(self.data) - 1)
+        self.anchor_date = date.fromisoformat(self.meta["anchor"])
+        self.timezone = pytz.timezone(self.meta["timezone"])
+        self._tabel = tabel_nama(wew if wew is not None else KaTikaWewaran(),
+                                 cal if cal is not None else KaTikaCalendar(),
+                                 sas if sas is not None else KaTikaSasih())
+        self._geser, shift = {}, 0
+        for field, n in self.BIT:
+            self._geser[field] = (np.uint64(shift), np.uint64((1 << n) - 1))
+            shift += n
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    # --- Membangun ---
+    @classmethod
+    def pak(cls, signals) -> np.ndarray:
+        idx = SIKLUS.gather(signals)
+        packed, shift = np.zeros(len(idx["tri"]), dtype=np.uint64), 0
+        for field, n in cls.BIT:
+            packed |= idx[field].astype(np.uint64) << np.uint64(shift)
+            shift += n
+        return packed
+
+    @staticmethod
+    def _detik(epoch, ords) -> np.ndarray:
+        detik = epoch - (ords - EPOCH_ORDINAL) * 86400.0
+        return np.where(np.isnan(detik), KaTikaArsip.KOSONG, np.round(np.nan_to_num(detik))).astype(np.int32)
+
+    @classmethod
+    def bangun(cls, path: str, start_date: date = None, end_date: date = None, lokasi=None,
+               astro: KaTikaPulse = None) -> "KaTikaArsip":
+        # Sunrise selalu lewat NOAA (vektor): astral lambat untuk ratusan ribu hari dan tidak
+        # bisa menghitung tahun 1
+        astro = (astro if astro is not None else KaTikaPulse(backend="noaa")).untuk(lokasi)
+        start_date, end_date = start_date or cls.AWAL, end_date or cls.AKHIR
+        ord0, n = start_date.toordinal(), (end_date - start_date).days + 1
+        anchor = astro.anchor_date.toordinal()
+        arr = np.lib.format.open_memmap(path, mode="w+", dtype=cls.DTYPE, shape=(n,))
+        for i in range(0, n, cls.BLOK):
+            ords = np.arange(ord0 + i, ord0 + min(n, i + cls.BLOK), dtype=np.int64)
+            blok = arr[i:i + len(ords)]
+            blok["signal"] = ords - anchor
+            blok["wewaran"] = cls.pak(ords - anchor)
+            sunrise, sunset = astro._hitung_matahari_batch(ords)
+            blok["sunrise"], blok["sunset"] = cls._detik(sunrise, ords), cls._detik(sunset, ords)
+        arr.flush()
+        del arr
+        lat, lon = KaTikaSuryaCache.location_key(astro.location)
+        with open(path + ".json", "w") as f:
+            json.dump({"versi": cls.VERSI, "start": start_date.isoformat(), "days": n,
+                       "anchor": astro.anchor_date.isoformat(), "lokasi": astro.location.name,
+                       "latitude": lat, "longitude": lon, "timezone": str(astro.timezone),
+                       "backend": "noaa", "bit": cls.BIT}, f)
+        return cls(path)
+
+    # --- Membaca ---
+    def _tanggal(self, signal: int) -> date:
+        return date.fromordinal(self.anchor_date.toordinal() + signal)
+
+    def _posisi(self, tanggal) -> int:
+        if isinstance(tanggal, datetime): tanggal = tanggal.date()
+        pos = tanggal.toordinal() - self.start.toordinal()
+        if not 0 <= pos < len(self.data):
+            raise ValueError(f"Tanggal {tanggal} di luar arsip ({self.start} s/d {self.end})")
+        return pos
+
+    def buka(self, records) -> dict:
+        # Record -> dict of arrays, kunci sama dengan KaTikaBatch.get_indeks (+ sunrise/sunset epoch)
+        packed = np.asarray(records["wewaran"])
+        signal = np.asarray(records["signal"], dtype=np.int64)
+        idx = {field: ((packed >> shift) & mask).astype(np.int8) for field, (shift, mask) in self._geser.items()}
+        urip = (np.asarray(KaTikaSiklus.URIP_SAPTA)[idx["sapta"]]
+                + np.asarray(KaTikaSiklus.URIP_PANCA)[idx["panca"]]).astype(np.int8)
+        idx["total_urip"], idx["weton"] = urip, (idx["sapta"] * 5 + idx["panca"]).astype(np.int8)
+        idx["is_purnama"], idx["is_tilem"] = idx["status_bulan"] == 0, idx["status_bulan"] == 1
+        idx["signal"] = signal
+        tengah_malam = (signal + self.anchor_date.toordinal() - EPOCH_ORDINAL) * 86400.0
+        for kolom in ("sunrise", "sunset"):
+            detik = np.asarray(records[kolom])
+            idx[kolom] = np.where(detik == self.KOSONG, np.nan, tengah_malam + detik)
+        return idx
+
+    def rentang(self, start_date=None, end_date=None) -> dict:
+        i = self._posisi(start_date or self.start)
+        j = self._posisi(end_date or self.end)
+        return self.buka(self.data[i:j + 1])
+
+    def iter_chunks(self, start_date=None, end_date=None, chunk: int = None):
+        i = self._posisi(start_date or self.start)
+        j = self._posisi(end_date or self.end) + 1
+        chunk = chunk or self.BLOK
+        for k in range(i, j, chunk):
+            yield self.buka(self.data[k:min(j, k + chunk)])
+
+    def hari(self, waktu) -> dict:
+        # Tanggal = dina siang hari itu; waktu (datetime) sebelum fajar masih dina kemarin
+        if isinstance(waktu, datetime):
+            waktu = self.timezone.localize(waktu) if waktu.tzinfo is None else waktu.astimezone(self.timezone)
+        pos = self._posisi(waktu)
+        if isinstance(waktu, datetime):
+            sunrise = self.buka(self.data[pos:pos + 1])["sunrise"][0]
+            if waktu.timestamp() < sunrise:
+                pos = self._posisi(date.fromordinal(self.start.toordinal() + pos - 1))
+        idx = self.buka(self.data[pos:pos + 1])
+        hasil = {"tanggal": date.fromordinal(self.start.toordinal() + pos), "signal": int(idx["signal"][0])}
+        for field, names in self._tabel.items():
+            hasil[field] = names[idx[field][0]]
+        hasil["total_urip"] = int(idx["total_urip"][0])
+        for kolom in ("sunrise", "sunset"):
+            epoch = idx[kolom][0]
+            hasil[kolom] = None if np.isnan(epoch) else datetime.fromtimestamp(round(epoch), self.timezone)
+        return hasil
+
+    # --- Statistik seluruh rentang (per blok) ---
+    def frekuensi(self, field: str, start_date=None, end_date=None) -> dict:
+        if field not in self._tabel:
+            raise ValueError(f"Field tidak dikenal: {field!r}")
+        names = self._tabel[field]
+        counts = np.zeros(len(names), dtype=np.int64)
+        for idx in self.iter_chunks(start_date, end_date):
+            counts += np.bincount(idx[field], minlength=len(names))
+        hasil = {}
+        for name, c in zip(names, counts.tolist()):
+            hasil[name] = hasil.get(name, 0) + c  # nama duplikat (Pasah) digabung
+        return hasil
+
+    def panjang_siang(self, start_date=None, end_date=None) -> dict:
+        # Statistik lama siang (sunset - sunrise) dalam jam
+        n, total = 0, 0.0
+        terpendek, terpanjang = (np.inf, None), (-np.inf, None)
+        for idx in self.iter_chunks(start_date, end_date):
+            jam = (idx["sunset"] - idx["sunrise"]) / 3600.0
+            if np.isnan(jam).all(): continue
+            i, j = np.nanargmin(jam), np.nanargmax(jam)
+            if jam[i] < terpendek[0]: terpendek = (jam[i], int(idx["signal"][i]))
+            if jam[j] > terpanjang[0]: terpanjang = (jam[j], int(idx["signal"][j]))
+            n += int(np.count_nonzero(~np.isnan(jam)))
+            total += float(np.nansum(jam))
+        if not n:
+            return {"hari": 0}
+        return {
+            "hari": n, "rata_jam": total / n,
+            "min_jam": float(terpendek[0]), "tanggal_terpendek": self._tanggal(terpendek[1]),
+            "maks_jam": float(terpanjang[0]), "tanggal_terpanjang": self._tanggal(terpanjang[1]),
+        }
@@ -0,0 +1,98 @@
+# ==========================================
+# 8. MODUL BATCH (VEKTOR / RENTANG TANGGAL)
+# ==========================================
+# Record ringkas per hari untuk streaming (string diambil dari tabel nama, tidak disalin)
+from __future__ import annotations
+from collections import namedtuple
+from datetime import datetime, timedelta
+import numpy as np
+from ._lazy import pd
+from .profiler import diukur
+from .siklus import SIKLUS
+from .wewaran import tabel_nama
+
+
+HariKaTika = namedtuple("HariKaTika", [
+    "tanggal", "signal", "sunrise", "sunset",
+    "tri", "catur", "panca", "sad", "sapta", "asta", "sanga", "dasa", "total_urip",
+    "wuku", "ingkel", "sasih", "status_bulan", "is_purnama", "is_tilem",
+])
+
+
+class KaTikaBatch:
+    def __init__(self, wew, cal, sas, astro):
+        self.wew, self.cal, self.sas, self.astro = wew, cal, sas, astro
+
+    @staticmethod
+    def _kategori(codes, names):
+        # Nama duplikat (mis. 2x Pasah di Tri Wara) digabung jadi satu kategori
+        uniq = list(dict.fromkeys(names))
+        remap = np.array([uniq.index(n) for n in names], dtype=np.int8)
+        return pd.Categorical.from_codes(remap[codes], categories=uniq)
+
+    def signals_for_range(self, start_date, end_date) -> np.ndarray:
+        # Dina dihitung pada jam 12 siang (selalu setelah fajar), jadi signal = selisih hari dari anchor
+        if isinstance(start_date, datetime): start_date = start_date.date()
+        if isinstance(end_date, datetime): end_date = end_date.date()
+        first = (start_date - self.astro.anchor_date).days
+        last = (end_date - self.astro.anchor_date).days
+        return np.arange(first, last + 1, dtype=np.int64)
+
+    def get_indeks(self, signals) -> dict:
+        s = np.asarray(signals, dtype=np.int64)
+        idx = SIKLUS.gather(s)
+        idx["signal"] = s
+        return idx
+
+    @diukur("batch.get_batch")
+    def get_batch(self, signals) -> pd.DataFrame:
+        idx = self.get_indeks(signals)
+        names = tabel_nama(self.wew, self.cal, self.sas)
+        cols = {"signal": idx["signal"]}
+        for key, tabel in names.items():
+            cols[key] = self._kategori(idx[key], tabel)
+        cols["total_urip"] = idx["total_urip"]
+        cols["wuku_index"] = idx["wuku"]
+        cols["is_purnama"], cols["is_tilem"] = idx["is_purnama"], idx["is_tilem"]
+        return pd.DataFrame(cols)
+
+    def get_range(self, start_date, end_date) -> pd.DataFrame:
+        signals = self.signals_for_range(start_date, end_date)
+        df = self.get_batch(signals)
+        # datetime64[D] mencakup seluruh rentang date Python (tahun 1..9999), beda dengan pd.date_range
+        df.insert(0, "tanggal", (np.datetime64(self.astro.anchor_date, "D") + signals).astype(object))
+        return df
+
+    def iter_chunks(self, start_date, end_date, location=None, chunk: int = SIKLUS.PERIODE, matahari: bool = True):
+        # Generator blok indeks (dict of arrays) per `chunk` hari; memori terbatas pada satu blok
+        astro = self.astro.untuk(location)
+        signals = self.signals_for_range(start_date, end_date)
+        ord0 = astro.anchor_date.toordinal()
+        for i in range(0, len(signals), chunk):
+            idx = self.get_indeks(signals[i:i + chunk])
+            if matahari:
+                idx["sunrise"], idx["sunset"] = astro.get_matahari_batch(idx["signal"] + ord0)
+            yield idx
+
+    def iter_days(self, start_date, end_date, location=None, chunk: int = SIKLUS.PERIODE, matahari: bool = True):
+        # Stream HariKaTika per hari dari start_date s/d end_date (inklusif)
+        astro = self.astro.untuk(location)
+        tz, anchor = astro.timezone, astro.anchor_date
+        names = tabel_nama(self.wew, self.cal, self.sas)
+        fields = HariKaTika._fields[4:17]
+        keys = [f for f in fields if f != "total_urip"]
+        for idx in self.iter_chunks(start_date, end_date, location, chunk, matahari):
+            cols = {k: idx[k].tolist() for k in fields}
+            for k in keys:
+                tabel = names[k]
+                cols[k] = [tabel[i] for i in cols[k]]
+            n = len(idx["signal"])
+            if matahari:
+                rise = [datetime.fromtimestamp(x, tz) for x in idx["sunrise"].tolist()]
+                sset = [datetime.fromtimestamp(x, tz) for x in idx["sunset"].tolist()]
+            else:
+                rise = sset = [None] * n
+            tanggal = [anchor + timedelta(days=s) for s in idx["signal"].tolist()]
+            yield from map(HariKaTika._make, zip(
+                tanggal, idx["signal"].tolist(), rise, sset, *(cols[k] for k in fields),
+                idx["is_purnama"].tolist(), idx["is_tilem"].tolist()))
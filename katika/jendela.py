@@ -0,0 +1,122 @@
+# ==========================================
+# 9. MODUL JENDELA (SLIDING WINDOW 365 HARI)
+# ==========================================
+# Jendela bergulir hasil evaluasi per hari (bitmask padewasan, sunrise/sunset, odalan).
+# Saat tanggal maju hanya hari yang baru masuk yang dihitung; hari lewat tertimpa di
+# ring buffer. State bisa disimpan ke disk (.npz) agar proses yang restart tidak scan ulang.
+from __future__ import annotations
+import os
+import json
+import hashlib
+import threading
+from datetime import datetime, timedelta
+import numpy as np
+from ._lazy import pd
+from .profiler import diukur
+from .siklus import SIKLUS
+from .surya import KaTikaSuryaCache
+
+
+class KaTikaJendela:
+    def __init__(self, padewasan, odalan, astro, horizon: int = 365, path: str = None, lokasi=None):
+        self.padewasan, self.odalan, self.astro = padewasan, odalan, astro.untuk(lokasi)
+        self.horizon, self.path = horizon, path
+        self._lock = threading.RLock()
+        self.start = None
+        self.bitmask = np.zeros(horizon, dtype=np.uint32)
+        self.sunrise = np.full(horizon, np.nan)
+        self.sunset = np.full(horizon, np.nan)
+        self.od_sig = np.empty(0, dtype=np.int64)
+        self.od_pid = np.empty(0, dtype=np.int64)
+        self.od_jenis = np.empty(0, dtype=np.int8)
+        if path and os.path.exists(path):
+            self.muat()
+
+    def _kunci(self) -> str:
+        # Berubah bila aturan, database pura, lokasi atau backend berubah -> state lama tidak dipakai
+        meta = [self.horizon, self.padewasan.CATEGORIES, self.padewasan.ATURAN, self.odalan.pura,
+                KaTikaSuryaCache.location_key(self.astro.location), self.astro.location.timezone,
+                self.astro.backend]
+        return hashlib.sha1(json.dumps(meta, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _signal(self, start_date) -> int:
+        if start_date is None:
+            start_date = datetime.now(self.astro.timezone) + timedelta(days=1)
+        if isinstance(start_date, datetime): start_date = start_date.date()
+        return (start_date - self.astro.anchor_date).days
+
+    @diukur("jendela.geser")
+    def geser(self, start_date=None) -> int:
+        # Majukan jendela ke start_date; kembalikan jumlah hari yang baru dievaluasi
+        s_new, H = self._signal(start_date), self.horizon
+        with self._lock:
+            if self.start is not None and self.start <= s_new < self.start + H:
+                first = self.start + H
+                keep = self.od_sig >= s_new
+                self.od_sig, self.od_pid, self.od_jenis = self.od_sig[keep], self.od_pid[keep], self.od_jenis[keep]
+            elif self.start == s_new:
+                return 0
+            else:
+                first = s_new
+                self.od_sig = np.empty(0, dtype=np.int64)
+                self.od_pid = np.empty(0, dtype=np.int64)
+                self.od_jenis = np.empty(0, dtype=np.int8)
+            last = s_new + H - 1
+            if last < first:
+                self.start = s_new
+                return 0
+
+            baru = np.arange(first, last + 1)
+            self.bitmask[baru % H] = self.padewasan.bitmask[baru % SIKLUS.PERIODE]
+            ordinals = baru + self.astro.anchor_date.toordinal()
+            self.sunrise[baru % H], self.sunset[baru % H] = self.astro.get_matahari_batch(ordinals)
+            sig, pid, jenis = self.odalan.cari_signal(first, last)
+            self.od_sig = np.concatenate([self.od_sig, sig])
+            self.od_pid = np.concatenate([self.od_pid, pid])
+            self.od_jenis = np.concatenate([self.od_jenis, jenis])
+            self.start = s_new
+            if self.path:
+                self.simpan()
+            return len(baru)
+
+    def simpan(self, path: str = None):
+        path = path or self.path
+        with self._lock:
+            tmp = path + ".tmp.npz"
+            np.savez(tmp, kunci=self._kunci(), start=self.start, bitmask=self.bitmask,
+                     sunrise=self.sunrise, sunset=self.sunset,
+                     od_sig=self.od_sig, od_pid=self.od_pid, od_jenis=self.od_jenis)
+            os.replace(tmp, path)
+
+    def muat(self, path: str = None) -> bool:
+        path = path or self.path
+        with self._lock, np.load(path) as data:
+            if str(data["kunci"]) != self._kunci():
+                return False
+            self.start = int(data["start"])
+            self.bitmask, self.sunrise, self.sunset = data["bitmask"], data["sunrise"], data["sunset"]
+            self.od_sig, self.od_pid, self.od_jenis = data["od_sig"], data["od_pid"], data["od_jenis"]
+            return True
+
+    def dewasa_ayu(self, kategori: str = None, start_date=None) -> list:
+        with self._lock:
+            self.geser(start_date)
+            sig = np.arange(self.start, self.start + self.horizon)
+            bits = self.bitmask[sig % self.horizon]
+        pad = self.padewasan
+        hasil = []
+        for bit, cat in enumerate(pad.CATEGORIES):
+            if kategori is not None and cat != kategori: continue
+            days = [self.astro.anchor_date + timedelta(days=int(s)) for s in sig[(bits >> bit) & 1 == 1]]
+            if days:
+                hasil.append({"kategori": cat, "Tanggal masehi": pad._format_date_ranges(days), "jumlah_hari": len(days)})
+        return hasil
+
+    def jadwal_odalan(self, start_date=None) -> pd.DataFrame:
+        with self._lock:
+            self.geser(start_date)
+            sig, pid, jenis = self.od_sig, self.od_pid, self.od_jenis
+            H, tz = self.horizon, self.astro.timezone
+            matahari = {s: (datetime.fromtimestamp(self.sunrise[s % H], tz), datetime.fromtimestamp(self.sunset[s % H], tz))
+                        for s in dict.fromkeys(sig.tolist())}
+        return self.odalan.ke_frame(sig, pid, jenis, self.astro, matahari)
@@ -0,0 +1,130 @@
+# ==========================================
+# 10. MODUL KUERI SIKLUS ("N KALI BERIKUTNYA")
+# ==========================================
+# Tiap field adalah residu dari signal, jadi konjungsi syarat diselesaikan langsung
+# (gaya Chinese Remainder): residu per field digabung menjadi himpunan residu modulo KPK
+# periodenya, lalu kemunculan dienumerasi sebagai k * periode + residu tanpa scan harian.
+# Sunrise hanya dihitung untuk tanggal hasil.
+from __future__ import annotations
+import json
+import math
+import threading
+from datetime import datetime, date
+import numpy as np
+from ._lazy import pd
+from .profiler import diukur
+from .siklus import SIKLUS
+from .surya import waktu_lokal
+from .wewaran import tabel_nama, indeks_nama
+
+
+class KaTikaKueri:
+    # Periode terkecil tiap field di tabel siklus
+    MODULUS = {
+        "tri": 4, "catur": 4, "panca": 5, "sad": 6, "sapta": 7, "asta": 8, "sanga": 9,
+        "dasa": 35, "total_urip": 35, "weton": 35, "wuku": 210, "ingkel": 42,
+        "sasih": 420, "status_bulan": 70, "is_purnama": 70, "is_tilem": 70,
+    }
+    # Kombinasi yang sering dicari
+    HARI_RAYA = {
+        "Kajeng Kliwon": {"tri": "Kajeng", "panca": "Kliwon"},
+        "Tumpek": {"sapta": "Saniscara", "panca": "Kliwon"},
+        "Anggara Kasih": {"sapta": "Anggara", "panca": "Kliwon"},
+        "Buda Cemeng": {"sapta": "Buda", "panca": "Wage"},
+        "Purnama": {"is_purnama": True},
+        "Tilem": {"is_tilem": True},
+    }
+
+    def __init__(self, wew, cal, sas, astro):
+        self.wew, self.cal, self.sas, self.astro = wew, cal, sas, astro
+        self._tabel = tabel_nama(wew, cal, sas)
+        self._solusi = {}
+        self._lock = threading.Lock()
+
+    def _residu_field(self, field: str, values) -> tuple:
+        if field not in self.MODULUS:
+            raise ValueError(f"Field tidak dikenal: {field!r}")
+        if not isinstance(values, (list, tuple, set, frozenset)):
+            values = [values]
+        m = self.MODULUS[field]
+        kode = indeks_nama(self._tabel, field, values) if field in self._tabel else [int(v) for v in values]
+        return m, np.flatnonzero(np.isin(SIKLUS.arrays[field][:m], kode))
+
+    @staticmethod
+    def _gabung(m1: int, r1: np.ndarray, m2: int, r2: np.ndarray) -> tuple:
+        # CRT umum (modulus tidak harus koprima): x = a (mod m1), x = b (mod m2)
+        # punya solusi bila a = b (mod gcd), unik modulo KPK(m1, m2)
+        g = math.gcd(m1, m2)
+        kpk = m1 // g * m2
+        a, b = r1[:, None], r2[None, :]
+        beda = b - a
+        k = (beda // g * pow(m1 // g, -1, m2 // g)) % (m2 // g)
+        x = (a + m1 * k) % kpk
+        return kpk, np.unique(x[beda % g == 0])
+
+    def residu(self, syarat: dict) -> tuple:
+        # (periode, residu terurut): hari cocok <=> signal % periode ada di residu
+        key = json.dumps(syarat, sort_keys=True, default=sorted)
+        with self._lock:
+            hasil = self._solusi.get(key)
+        if hasil is None:
+            periode, residu = 1, np.zeros(1, dtype=np.int64)
+            for field, values in syarat.items():
+                m, r = self._residu_field(field, values)
+                periode, residu = self._gabung(periode, residu, m, r)
+            residu.setflags(write=False)
+            hasil = (periode, residu)
+            with self._lock:
+                self._solusi[key] = hasil
+        return hasil
+
+    def signals(self, syarat: dict, s0: int, s1: int = None, n: int = None) -> np.ndarray:
+        # Signal cocok dalam [s0, s1] (maks n); kerja sebanding jumlah hasil
+        periode, residu = self.residu(syarat)
+        if not len(residu) or (s1 is not None and s1 < s0) or n == 0:
+            return np.empty(0, dtype=np.int64)
+        k0 = s0 // periode
+        k1 = k0 + -(-n // len(residu)) if n is not None else s1 // periode
+        if s1 is not None:
+            k1 = min(k1, s1 // periode)
+        sig = (np.arange(k0, k1 + 1, dtype=np.int64)[:, None] * periode + residu[None, :]).ravel()
+        sig = sig[sig >= s0]
+        if s1 is not None:
+            sig = sig[sig <= s1]
+        return sig[:n] if n is not None else sig
+
+    def _signal(self, when, astro) -> int:
+        # Titik awal/akhir berupa waktu mengikuti pergantian dina saat fajar; tanggal = dina siang hari itu
+        if when is None:
+            when = datetime.now(astro.timezone)
+        if isinstance(when, datetime):
+            return astro.get_heartbeat(when)["signal"]
+        return (when - astro.anchor_date).days
+
+    def ke_frame(self, sig, astro=None) -> pd.DataFrame:
+        # Dina berlangsung dari fajar tanggalnya sampai fajar keesokan hari
+        astro = astro if astro is not None else self.astro
+        ords = np.asarray(sig, dtype=np.int64) + astro.anchor_date.toordinal()
+        hari = np.union1d(ords, ords + 1)
+        sunrise, _ = astro.get_matahari_batch(hari)
+        fajar = waktu_lokal(sunrise, astro.timezone)
+        return pd.DataFrame({
+            "Tanggal": [date.fromordinal(o) for o in ords.tolist()],
+            "signal": sig,
+            "Mulai": fajar[np.searchsorted(hari, ords)],
+            "Selesai": fajar[np.searchsorted(hari, ords + 1)],
+        })
+
+    @diukur("kueri.cari")
+    def cari(self, syarat, n: int = None, start_date=None, end_date=None, lokasi=None) -> pd.DataFrame:
+        # syarat: {field: nilai atau [nilai...]} (AND antar field) atau nama di HARI_RAYA
+        if isinstance(syarat, str):
+            if syarat not in self.HARI_RAYA:
+                raise ValueError(f"Hari raya tidak dikenal: {syarat!r}")
+            syarat = self.HARI_RAYA[syarat]
+        if n is None and end_date is None:
+            raise ValueError("Isi n atau end_date")
+        astro = self.astro.untuk(lokasi)
+        s1 = None if end_date is None else self._signal(end_date, astro)
+        sig = self.signals(syarat, self._signal(start_date, astro), s1, n)
+        return self.ke_frame(sig, astro)
@@ -0,0 +1,42 @@
+# ==========================================
+# MODUL BERSAMA (SEKALI PER PROSES)
+# ==========================================
+# Objek engine dibangun sekali per proses per (backend, lokasi) lalu dibagi semua
+# pemanggil: dashboard, API server, worker ekspor dan benchmark.
+import threading
+
+from .surya import KaTikaPulse
+from .wewaran import KaTikaWewaran, KaTikaCalendar, KaTikaSasih
+from .padewasan import KaTikaPadewasan
+from .odalan import KaTikaOdalan
+from .otonan import KaTikaOtonan
+from .batch import KaTikaBatch
+from .kueri import KaTikaKueri
+
+_MODULES = {}
+_MODULES_LOCK = threading.Lock()
+
+
+def bangun_modules(backend: str = "astral", lokasi=None, sun_cache=None) -> dict:
+    # Selalu membuat objek baru (mis. benchmark dengan cache matahari sendiri)
+    pulse = KaTikaPulse(sun_cache=sun_cache, backend=backend, location=lokasi)
+    wew, cal, sas = KaTikaWewaran(), KaTikaCalendar(), KaTikaSasih()
+    return {
+        "pulse": pulse, "wew": wew, "cal": cal, "sas": sas,
+        "padewasan": KaTikaPadewasan(cal, wew, sas, pulse),
+        "odalan": KaTikaOdalan(wew=wew, cal=cal, sas=sas, astro=pulse),
+        "otonan": KaTikaOtonan(pulse, cal, wew, sas),
+        "batch": KaTikaBatch(wew, cal, sas, pulse),
+        "kueri": KaTikaKueri(wew, cal, sas, pulse),
+    }
+
+
+def get_modules(backend: str = "astral", lokasi=None) -> dict:
+    key = (backend, lokasi)
+    mods = _MODULES.get(key)
+    if mods is None:
+        with _MODULES_LOCK:
+            mods = _MODULES.get(key)
+            if mods is None:
+                mods = _MODULES[key] = bangun_modules(backend, lokasi)
+    return mods
@@ -0,0 +1,165 @@
+# ==========================================
+# 6. MODUL ODALAN (DB LENGKAP)
+# ==========================================
+# Format file database (CSV, header wajib):
+#   pura,sapta,panca,wuku,sasih,status_bulan
+#   Pura Luhur Uluwatu,Anggara,Kliwon,Medangsia,,
+#   Pura Besakih,,,,Kadasa,PURNAMA
+# Baris pawukon mengisi sapta/panca/wuku (siklus 210 hari), baris sasih mengisi
+# sasih/status_bulan (siklus 420 hari).
+from __future__ import annotations
+import os
+import csv
+from datetime import datetime, date, time, timedelta
+import numpy as np
+from ._lazy import pd
+from .profiler import diukur
+from .siklus import SIKLUS
+from .surya import KaTikaPulse
+from .wewaran import KaTikaWewaran, KaTikaCalendar, KaTikaSasih, tabel_nama, indeks_nama
+
+
+class KaTikaOdalan:
+    JENIS = ["pawukon", "sasih"]
+
+    def __init__(self, path: str = None, wew=None, cal=None, sas=None, astro=None):
+        self.wew = wew if wew is not None else KaTikaWewaran()
+        self.cal = cal if cal is not None else KaTikaCalendar()
+        self.sas = sas if sas is not None else KaTikaSasih()
+        self.astro = astro if astro is not None else KaTikaPulse()
+        # Database Pawukon (Sad Kahyangan & Jajar Kemiri)
+        self.DB_PAWUKON = {
+            ('Anggara', 'Kliwon', 'Medangsia'): ["Pura Luhur Uluwatu", "Pura Taman Ayun"],
+            ('Buda', 'Wage', 'Langkir'): ["Pura Tanah Lot (Buda Cemeng)"],
+            ('Wraspati', 'Umanis', 'Dungulan'): ["Pura Luhur Batukaru"],
+            ('Saniscara', 'Kliwon', 'Dungulan'): ["Pura Lempuyang Luhur (Kuningan)"],
+            ('Saniscara', 'Kliwon', 'Wayang'): ["Pura Dasar Buana Gelgel"],
+            # Jajar Kemiri Tabanan
+            ('Saniscara', 'Kliwon', 'Wariga'): ["Pura Luhur Besikalung"],
+            ('Saniscara', 'Kliwon', 'Krulut'): ["Pura Luhur Muncak Sari"],
+            ('Buda', 'Umanis', 'Prangbakat'): ["Pura Luhur Tambawaras"],
+            ('Buda', 'Kliwon', 'Ugu'): ["Pura Luhur Petali"],
+        }
+        # Database Sasih
+        self.DB_SASIH = {
+            ('Kadasa', 'PURNAMA'): ["Pura Besakih", "Pura Ulun Danu Batur", "Pura Tuluk Biyu"],
+            ('Kapat', 'PURNAMA'): ["Pura Jati Batur", "Pura Pulaki"]
+        }
+        path = path or os.environ.get("KATIKA_ODALAN_DB")
+        if path:
+            self.muat_file(path)
+        else:
+            self._build_index()
+
+    def muat_file(self, path: str):
+        pawukon, sasih = {}, {}
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                pura = row["pura"].strip()
+                if row.get("wuku"):
+                    key = (row["sapta"].strip(), row["panca"].strip(), row["wuku"].strip())
+                    pawukon.setdefault(key, []).append(pura)
+                else:
+                    key = (row["sasih"].strip(), row["status_bulan"].strip().upper())
+                    sasih.setdefault(key, []).append(pura)
+        self.DB_PAWUKON, self.DB_SASIH = pawukon, sasih
+        self._build_index()
+
+    def _posisi_pawukon(self, sapta, panca, wuku) -> list:
+        # Posisi dalam siklus 210 hari: wuku*7 + sapta, lalu panca harus cocok (mod 5)
+        tabel = self._tabel
+        pos = indeks_nama(tabel, "wuku", [wuku])[0] * 7 + indeks_nama(tabel, "sapta", [sapta])[0]
+        return [pos] if pos % 5 == indeks_nama(tabel, "panca", [panca])[0] else []
+
+    def _posisi_sasih(self, sasih, status) -> list:
+        s_idx = indeks_nama(self._tabel, "sasih", [sasih])[0]
+        st_idx = indeks_nama(self._tabel, "status_bulan", [status])[0]
+        arr = SIKLUS.arrays
+        return np.flatnonzero((arr["sasih"][:420] == s_idx) & (arr["status_bulan"][:420] == st_idx)).tolist()
+
+    def _build_index(self):
+        # Index: posisi siklus -> id pura. Id mengikuti urutan database.
+        self._tabel = tabel_nama(self.wew, self.cal, self.sas)
+        self.pura, self._idx = [], ({}, {})
+        self._per_pura = {}
+        # Kunci yang tidak pernah terjadi dalam siklus (mis. panca tidak cocok dengan wuku)
+        self.tidak_pernah = []
+        for jenis, (db, periode) in enumerate(((self.DB_PAWUKON, 210), (self.DB_SASIH, 420))):
+            for key, names in db.items():
+                posisi = self._posisi_pawukon(*key) if jenis == 0 else self._posisi_sasih(*key)
+                if not posisi:
+                    self.tidak_pernah.append(key)
+                for nama in names:
+                    pid = len(self.pura)
+                    self.pura.append(nama)
+                    for pos in posisi:
+                        self._idx[jenis].setdefault(pos, []).append(pid)
+                        self._per_pura.setdefault(nama, []).append((periode, pos))
+        # Satu pura bisa punya beberapa odalan -> kategori unik + kode per id
+        self._pura_kategori = list(dict.fromkeys(self.pura))
+        self._kode_pura = {nama: i for i, nama in enumerate(self._pura_kategori)}
+        self._pura_kode = np.array([self._kode_pura[nama] for nama in self.pura], dtype=np.int32)
+
+    def _signal(self, d) -> int:
+        if isinstance(d, datetime): d = d.date()
+        return (d - self.astro.anchor_date).days
+
+    @diukur("odalan.cari_signal")
+    def cari_signal(self, s0: int, s1: int) -> tuple:
+        # Semua odalan di signal [s0, s1] langsung dari aritmetika siklus (tanpa scan harian)
+        sig, pid, jenis = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int8)]
+        for j, periode in enumerate((210, 420)):
+            for pos, ids in self._idx[j].items():
+                occ = np.arange(s0 + (pos - s0) % periode, s1 + 1, periode)
+                if not len(occ): continue
+                sig.append(np.repeat(occ, len(ids)))
+                pid.append(np.tile(np.asarray(ids, dtype=np.int64), len(occ)))
+                jenis.append(np.full(len(occ) * len(ids), j, dtype=np.int8))
+        sig, pid, jenis = np.concatenate(sig), np.concatenate(pid), np.concatenate(jenis)
+        order = np.lexsort((pid, jenis, sig))
+        return sig[order], pid[order], jenis[order]
+
+    @diukur("odalan.ke_frame")
+    def ke_frame(self, sig, pid, jenis, astro=None, matahari=None) -> pd.DataFrame:
+        # matahari: {signal: (sunrise, sunset)} bila sudah diketahui; selain itu via heartbeat (cache)
+        astro = astro if astro is not None else self.astro
+        tanggal = [astro.anchor_date + timedelta(days=int(s)) for s in sig]
+        # Waktu: fajar s/d 1 jam sebelum sunset (sunrise hanya untuk tanggal hasil)
+        waktu = {}
+        for s, d in dict(zip(sig.tolist(), tanggal)).items():
+            if matahari is not None and s in matahari:
+                sunrise, sunset = matahari[s]
+            else:
+                pulse = astro.get_heartbeat(datetime.combine(d, time(12, 0)))
+                sunrise, sunset = pulse['sunrise'], pulse['sunset']
+            waktu[d] = (sunrise, sunset - timedelta(hours=1))
+        return pd.DataFrame({
+            "Tanggal": tanggal,
+            "signal": sig,
+            "Pura": pd.Categorical.from_codes(self._pura_kode[pid], categories=self._pura_kategori),
+            "Jenis": pd.Categorical.from_codes(jenis, categories=self.JENIS),
+            "Mulai": [waktu[d][0] for d in tanggal],
+            "Selesai": [waktu[d][1] for d in tanggal],
+        })
+
+    def cari_rentang(self, start_date, end_date, astro=None, lokasi=None) -> pd.DataFrame:
+        astro = (astro if astro is not None else self.astro).untuk(lokasi)
+        sig, pid, jenis = self.cari_signal(self._signal(start_date), self._signal(end_date))
+        return self.ke_frame(sig, pid, jenis, astro)
+
+    @diukur("odalan.odalan_berikutnya")
+    def odalan_berikutnya(self, pura: str, start_date=None, lokasi=None) -> date:
+        if pura not in self._kode_pura:
+            raise KeyError(f"Pura tidak ada di database: {pura!r}")
+        if start_date is None:
+            start_date = datetime.now(self.astro.untuk(lokasi).timezone)
+        if pura not in self._per_pura:
+            return None
+        s0 = self._signal(start_date)
+        nxt = min(s0 + (pos - s0) % periode for periode, pos in self._per_pura[pura])
+        return self.astro.anchor_date + timedelta(days=nxt)
+
+    def scan_year(self, wew_mod, cal_mod, sas_mod, astro_mod, lokasi=None) -> pd.DataFrame:
+        astro_mod = astro_mod.untuk(lokasi)
+        start = (datetime.now(astro_mod.timezone) + timedelta(days=1)).date()
+        return self.cari_rentang(start, start + timedelta(days=364), astro_mod)
@@ -0,0 +1,107 @@
+# ==========================================
+# 7. MODUL OTONAN (WRAPPER)
+# ==========================================
+from __future__ import annotations
+from datetime import datetime, time, timedelta
+import numpy as np
+from ._lazy import pd
+from .profiler import diukur
+from .siklus import SIKLUS
+
+
+class KaTikaOtonan:
+    def __init__(self, astro, cal, wew, sas):
+        self.astro, self.cal, self.wew, self.sas = astro, cal, wew, sas
+    
+    @diukur("otonan.hitung")
+    def hitung(self, tgl_lahir, lokasi=None):
+        astro = self.astro.untuk(lokasi)
+        if isinstance(tgl_lahir, datetime): tgl_lahir_date = tgl_lahir.date()
+        else: tgl_lahir_date = tgl_lahir
+        
+        # Normalisasi ke Jam 12 Siang
+        birth_noon = datetime.combine(tgl_lahir_date, time(12, 0, 0))
+        birth_noon = astro.timezone.localize(birth_noon)
+
+        pulse = astro.get_heartbeat(birth_noon)
+        wew = self.wew.get_wewaran_lengkap(pulse['signal'])
+        cal = self.cal.get_calendar(pulse['signal'], wew)
+        
+        # Next Otonan
+        now = datetime.now(astro.timezone).date()
+        delta = (now - tgl_lahir_date).days
+        days_until = 210 - (delta % 210)
+        if days_until == 210: days_until = 0
+        
+        return {
+            "weton_text": f"{wew['sapta']} {wew['panca']} {cal['wuku_name']}",
+            "urip_total": wew['total_urip'],
+            "hasil_analisa": {"bintang": wew['lintang_nama'], "watak": wew['lintang_sifat']},
+            "next_otonan_date": now + timedelta(days=days_until),
+            "sisa_hari": days_until
+        }
+
+    def _tanggal_lahir(self, tgl_lahir, kolom: str) -> tuple:
+        # Terima list/array tanggal, Series, DataFrame (kolom `kolom`) atau path CSV
+        if isinstance(tgl_lahir, str):
+            tgl_lahir = pd.read_csv(tgl_lahir)
+        if isinstance(tgl_lahir, pd.DataFrame):
+            frame, series = tgl_lahir.reset_index(drop=True), tgl_lahir[kolom]
+        else:
+            frame, series = None, pd.Series(list(tgl_lahir) if not isinstance(tgl_lahir, (pd.Series, np.ndarray)) else tgl_lahir)
+        # Tanggal kosong / tidak valid -> NaT (baris hasilnya dibiarkan kosong)
+        series = pd.to_datetime(series.reset_index(drop=True), errors="coerce")
+        if series.dt.tz is not None:
+            series = series.dt.tz_localize(None)  # tanggal lokal seperti hitung()
+        return frame, series.to_numpy().astype("datetime64[D]")
+
+    @diukur("otonan.hitung_batch")
+    def hitung_batch(self, tgl_lahir, kolom: str = "tgl_lahir", today=None, lokasi=None) -> pd.DataFrame:
+        # Versi vektor dari hitung(): tanpa perhitungan matahari (jam 12 siang selalu setelah fajar)
+        frame, lahir = self._tanggal_lahir(tgl_lahir, kolom)
+        today = today or datetime.now(self.astro.untuk(lokasi).timezone).date()
+        kosong = np.isnat(lahir)
+        if kosong.any():
+            lahir = np.where(kosong, np.datetime64(self.astro.anchor_date, "D"), lahir)
+        signal = (lahir - np.datetime64(self.astro.anchor_date, "D")).astype(np.int64)
+        idx = SIKLUS.gather(signal)
+
+        # Tabel 210 weton & 35 lintang, lalu diindeks per anggota
+        pos = signal % 210
+        w, c = self.wew, self.cal
+        teks = [f"{w.SAPTA_WARA[p % 7]} {w.PANCA_WARA[p % 5]} {c.WUKU[p // 7]}" for p in range(210)]
+        weton = [w.DATA_LINTANG.get((p // 5, p % 5), w.DEFAULT_WATAK) for p in range(35)]
+        lintang = idx["weton"].astype(np.int64)
+
+        delta = (np.datetime64(today, "D") - lahir).astype(np.int64)
+        sisa = (-delta) % 210
+        urip = idx["total_urip"].astype(np.int64)
+        nama = np.array([x["nama"] for x in weton], dtype=object)[lintang]
+        sifat = np.array([x["sifat"] for x in weton], dtype=object)[lintang]
+        next_date = np.datetime64(today, "D") + sisa
+        if kosong.any():
+            pos = np.where(kosong, -1, pos)
+            nama[kosong], sifat[kosong], next_date[kosong] = None, None, np.datetime64("NaT")
+            urip = pd.array(np.where(kosong, 0, urip), dtype="Int64")
+            urip[kosong] = pd.NA
+            sisa = pd.array(sisa, dtype="Int64")
+            sisa[kosong] = pd.NA
+        hasil = pd.DataFrame({
+            "weton_text": pd.Categorical.from_codes(pos, categories=teks),
+            "urip_total": urip,
+            "lintang_nama": pd.Categorical(nama),
+            "lintang_sifat": pd.Categorical(sifat),
+            "next_otonan_date": next_date,
+            "sisa_hari": sisa,
+        })
+        if frame is not None:
+            hasil = pd.concat([frame, hasil], axis=1)
+        return hasil
+
+    def otonan_mendatang(self, tgl_lahir, n_hari: int = 30, kolom: str = "tgl_lahir", today=None,
+                         lokasi=None) -> pd.DataFrame:
+        # Semua anggota yang otonannya jatuh dalam n_hari ke depan (hari ini = 0), urut tanggal
+        hasil = self.hitung_batch(tgl_lahir, kolom, today, lokasi)
+        # Anggota tanpa tanggal lahir valid tidak punya otonan
+        hasil = hasil[(hasil["sisa_hari"] < n_hari).fillna(False).astype(bool)]
+        return hasil.sort_values("sisa_hari", kind="stable")
@@ -0,0 +1,162 @@
+# ==========================================
+# 5. MODUL PADEWASAN (8 KATEGORI + RULE WARIGA)
+# ==========================================
+# Aturan Wariga sebagai data. Tiap syarat = daftar alternatif (OR), tiap alternatif =
+# {field: [nilai yang diizinkan]} (AND). "kecuali" merujuk ke EKSKLUSI, "larangan" = field
+# yang tidak boleh bernilai tsb. Aturan dikompilasi ke mask boolean atas tabel siklus 2520 hari.
+from datetime import datetime, date, timedelta
+import numpy as np
+from .profiler import diukur
+from .siklus import SIKLUS
+from .wewaran import tabel_nama, indeks_nama
+
+
+EKSKLUSI_WARIGA = {
+    "uncal_balung": [{"wuku": ["Dungulan", "Kuningan", "Langkir", "Medangsia", "Pujut", "Pahang"]}],
+    "rangda_tiga": [{"wuku": ["Wariga", "Warigadean", "Pujut", "Pahang", "Menail", "Prangbakat"]}],
+    "kala_gotongan": [{"sapta": ["Saniscara"], "panca": ["Paing"]}],
+}
+
+ATURAN_WARIGA = {
+    # 1. Pernikahan (No Uncal, No Rangda Tiga, No Ingkel Wong)
+    "Pernikahan (Wiwaha)": {
+        "kecuali": ["uncal_balung", "rangda_tiga", "kala_gotongan"],
+        "larangan": {"ingkel": ["Wong"]},
+        "syarat": [{"sapta": ["Wraspati", "Sukra"], "panca": ["Umanis", "Kliwon"]}],
+    },
+    # 2. Membangun (No Kala Gotongan, No Ingkel Taru)
+    "Membangun (Wisma)": {
+        "kecuali": ["kala_gotongan"],
+        "larangan": {"ingkel": ["Taru"]},
+        "syarat": [{"sapta": ["Saniscara"]}, {"sapta": ["Wraspati"], "panca": ["Pon"]}],
+    },
+    # 3. Pertanian (Tanam Tuwuh)
+    "Pertanian (Tanam Tuwuh)": {
+        "kecuali": ["kala_gotongan"],
+        "larangan": {"ingkel": ["Taru", "Buku"]},
+        "syarat": [{"sapta": ["Soma", "Wraspati", "Sukra"]}],
+    },
+    # 4. Peternakan (No Ingkel Sato/Mina)
+    "Peternakan (Wewalungan)": {
+        "kecuali": ["kala_gotongan"],
+        "larangan": {"ingkel": ["Sato", "Mina"]},
+        "syarat": [{"sapta": ["Wraspati", "Saniscara"]}, {"wuku": ["Uye"]}],
+    },
+    # 5. Perabotan (Anggara/Pasah, No Ingkel Buku)
+    "Perabotan (Pande/Alat)": {
+        "kecuali": ["kala_gotongan"],
+        "larangan": {"ingkel": ["Buku"]},
+        "syarat": [{"sapta": ["Anggara"]}, {"tri": ["Pasah"]}],
+    },
+    # 6. Ekonomi (Pasah; Soma Pon/Buda Wage hanya berlaku bila jatuh di Pasah)
+    "Ekonomi (Dagang)": {
+        "kecuali": ["kala_gotongan"],
+        "syarat": [{"tri": ["Pasah"]}],
+    },
+    # 7. Melaut (Mina)
+    "Melaut (Mina)": {
+        "kecuali": ["kala_gotongan"],
+        "larangan": {"ingkel": ["Mina"]},
+        "syarat": [{"tri": ["Pasah"]}, {"sapta": ["Soma"]}],
+    },
+    # 8. Upacara (Yadnya): Purnama, Tilem atau Kajeng Kliwon
+    "Upacara (Yadnya)": {
+        "kecuali": ["uncal_balung", "kala_gotongan"],
+        "syarat": [{"status_bulan": ["PURNAMA", "TILEM"]}, {"tri": ["Kajeng"], "panca": ["Kliwon"]}],
+    },
+}
+
+
+class KaTikaPadewasan:
+    def __init__(self, cal, wew, sas, astro, aturan: dict = None, eksklusi: dict = None):
+        self.cal, self.wew, self.sas, self.astro = cal, wew, sas, astro
+        self.ATURAN = dict(ATURAN_WARIGA if aturan is None else aturan)
+        self.EKSKLUSI = dict(EKSKLUSI_WARIGA if eksklusi is None else eksklusi)
+        self.compile()
+
+    def _mask(self, alternatif: list) -> np.ndarray:
+        mask = np.zeros(SIKLUS.PERIODE, dtype=bool)
+        for alt in alternatif:
+            m = np.ones(SIKLUS.PERIODE, dtype=bool)
+            for field, values in alt.items():
+                m &= np.isin(SIKLUS.arrays[field], indeks_nama(self._tabel, field, values))
+            mask |= m
+        return mask
+
+    @diukur("padewasan.compile")
+    def compile(self):
+        # Mask per kategori (bool[2520]) + bitmask gabungan (bit i = kategori i)
+        self._tabel = tabel_nama(self.wew, self.cal, self.sas)
+        eksklusi = {k: self._mask(v) for k, v in self.EKSKLUSI.items()}
+        self.CATEGORIES = list(self.ATURAN)
+        self._masks = {}
+        for cat, rule in self.ATURAN.items():
+            mask = self._mask(rule["syarat"])
+            for nama in rule.get("kecuali", []):
+                mask &= ~eksklusi[nama]
+            for field, values in rule.get("larangan", {}).items():
+                mask &= ~self._mask([{field: values}])
+            mask.setflags(write=False)
+            self._masks[cat] = mask
+        self.bitmask = np.zeros(SIKLUS.PERIODE, dtype=np.uint32)
+        for bit, cat in enumerate(self.CATEGORIES):
+            self.bitmask |= self._masks[cat].astype(np.uint32) << bit
+
+    def tambah_aturan(self, kategori: str, aturan: dict):
+        self.ATURAN[kategori] = aturan
+        self.compile()
+
+    def _start_date(self, start_date=None, lokasi=None) -> date:
+        if start_date is None:
+            start_date = datetime.now(self.astro.untuk(lokasi).timezone) + timedelta(days=1)
+        return start_date.date() if isinstance(start_date, datetime) else start_date
+
+    @diukur("padewasan.format_date_ranges")
+    def _format_date_ranges(self, date_list):
+        if not date_list: return ""
+        sorted_dates = sorted(list(set(date_list)))
+        ranges = []
+        if not sorted_dates: return ""
+        start, end = sorted_dates[0], sorted_dates[0]
+        bln = ["", "Jan", "Feb", "Mar", "Apr", "Mei", "Jun", "Jul", "Ags", "Sep", "Okt", "Nov", "Des"]
+        for i in range(1, len(sorted_dates)):
+            curr = sorted_dates[i]
+            if (curr - end).days == 1: end = curr
+            else:
+                ranges.append(self._str(start, end, bln))
+                start, end = curr, curr
+        ranges.append(self._str(start, end, bln))
+        return ", ".join(ranges)
+
+    def _str(self, start, end, bln):
+        if start == end: return f"{start.day} {bln[start.month]} {start.year}"
+        elif start.month == end.month: return f"{start.day}-{end.day} {bln[start.month]} {start.year}"
+        else: return f"{start.day} {bln[start.month]} - {end.day} {bln[end.month]} {end.year}"
+
+    @diukur("padewasan.cari_hari")
+    def cari_hari(self, kategori: str, start_date=None, days: int = 365, lokasi=None) -> list:
+        # Dina dievaluasi jam 12 siang, jadi signal = selisih hari dari anchor
+        start = self._start_date(start_date, lokasi)
+        first = (start - self.astro.anchor_date).days
+        offsets = np.flatnonzero(self._masks[kategori][np.arange(first, first + days) % SIKLUS.PERIODE])
+        return [start + timedelta(days=int(o)) for o in offsets]
+
+    @diukur("padewasan.cari_n_hari")
+    def cari_n_hari(self, kategori: str, n: int, start_date=None, max_days: int = 36500, lokasi=None) -> list:
+        # Early exit: evaluasi per blok 1 siklus (2520 hari) sampai n hari ditemukan
+        if n < 1:
+            raise ValueError(f"n harus >= 1 (diberikan {n})")
+        start = self._start_date(start_date, lokasi)
+        found = []
+        for offset in range(0, max_days, SIKLUS.PERIODE):
+            chunk = min(SIKLUS.PERIODE, max_days - offset)
+            found.extend(self.cari_hari(kategori, start + timedelta(days=offset), chunk)[:n - len(found)])
+            if len(found) >= n: break
+        return found
+
+    @diukur("padewasan.cari_dewasa_ayu")
+    def cari_dewasa_ayu(self, kategori: str = None, start_date=None, days: int = 365, lokasi=None) -> list:
+        cats = self.CATEGORIES if kategori is None else [kategori]
+        start = self._start_date(start_date, lokasi)
+        raw_results = {cat: self.cari_hari(cat, start, days) for cat in cats}
+        return [{"kategori": k, "Tanggal masehi": self._format_date_ranges(v), "jumlah_hari": len(v)} for k, v in raw_results.items() if v]
@@ -0,0 +1,114 @@
+# ==========================================
+# INSTRUMENTASI (PROFILER)
+# ==========================================
+# Timing + jumlah panggilan per method yang ditandai @diukur. Bisa dinyalakan saat runtime
+# (PROFILER.aktifkan / env KATIKA_PROFILE=1). Total dicatat per proses saat saklar itu aktif;
+# statistik per request dicatat bila request dibuka dengan PROFILER.mulai_request(), terlepas
+# dari saklar proses (contextvar, aman untuk thread/async).
+# Saat semua mati, @diukur hanya memeriksa satu flag modul (_AKTIF) sebelum memanggil method
+# aslinya: lookup per hari (wewaran, calendar, sasih, heartbeat) tetap murah.
+# Waktu bersifat inklusif: method yang memanggil method lain ikut menghitung waktunya.
+import os
+import json
+import functools
+import threading
+import weakref
+import contextvars
+from time import perf_counter
+
+# True bila saklar proses menyala atau masih ada statistik request yang hidup
+_AKTIF = False
+
+
+class _StatistikRequest(dict):
+    # dict biasa tidak bisa di-weakref; weakref dipakai untuk tahu kapan request selesai
+    __slots__ = ("__weakref__",)
+
+
+class KaTikaProfiler:
+    def __init__(self):
+        self.enabled = os.environ.get("KATIKA_PROFILE") == "1"
+        self._lock = threading.Lock()
+        self._total = {}
+        self._request = contextvars.ContextVar("katika_request", default=None)
+        self._hidup = 0  # jumlah statistik request yang belum dibuang
+        # RLock: finalizer bisa jalan (GC) saat thread yang sama sedang memegang lock ini
+        self._lock_flag = threading.RLock()
+        self._perbarui_flag()
+
+    def _perbarui_flag(self):
+        global _AKTIF
+        _AKTIF = self.enabled or self._hidup > 0
+
+    def _request_selesai(self):
+        with self._lock_flag:
+            self._hidup -= 1
+            self._perbarui_flag()
+
+    def aktifkan(self, on: bool = True):
+        with self._lock_flag:
+            self.enabled = on
+            self._perbarui_flag()
+
+    def mulai_request(self, aktif: bool = True) -> dict:
+        # Statistik per request berdiri sendiri: aktif walau profiling proses (enabled) mati,
+        # dan aktif=False hanya mematikan pencatatan untuk konteks ini
+        stats = _StatistikRequest() if aktif else None
+        if stats is not None:
+            with self._lock_flag:
+                self._hidup += 1
+                self._perbarui_flag()
+            weakref.finalize(stats, self._request_selesai)
+        self._request.set(stats)
+        return stats
+
+    def request_aktif(self) -> bool:
+        return self._request.get() is not None
+
+    def catat(self, name: str, detik: float):
+        if self.enabled:
+            with self._lock:
+                row = self._total.setdefault(name, [0, 0.0])
+                row[0] += 1
+                row[1] += detik
+        stats = self._request.get()
+        if stats is not None:
+            row = stats.setdefault(name, [0, 0.0])
+            row[0] += 1
+            row[1] += detik
+
+    def reset(self):
+        with self._lock:
+            self._total.clear()
+
+    def ringkasan(self, stats: dict = None) -> list:
+        if stats is None:
+            with self._lock:
+                stats = {k: list(v) for k, v in self._total.items()}
+        rows = [{"method": k, "calls": c, "total_ms": s * 1e3, "avg_us": s / c * 1e6 if c else 0.0}
+                for k, (c, s) in stats.items()]
+        return sorted(rows, key=lambda r: r["total_ms"], reverse=True)
+
+    def to_json(self, stats: dict = None) -> str:
+        data = {"enabled": self.enabled, "total": self.ringkasan()}
+        if stats is not None:
+            data["request"] = self.ringkasan(stats)
+        return json.dumps(data, indent=2)
+
+
+PROFILER = KaTikaProfiler()
+
+
+def diukur(name: str):
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _AKTIF or not (PROFILER.enabled or PROFILER.request_aktif()):
+                return fn(*args, **kwargs)
+            t0 = perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                PROFILER.catat(name, perf_counter() - t0)
+        return wrapper
+    return deco
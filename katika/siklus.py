@@ -0,0 +1,71 @@
+# ==========================================
+# 0. TABEL SIKLUS (2520 HARI)
+# ==========================================
+# Semua wewaran (mod 4..9), wuku (210 hari) dan sasih (420 hari) berulang bersama
+# setiap KPK(4, 5, 6, 7, 8, 9) = 2520 hari. Tabel dibangun sekali saat import.
+import numpy as np
+
+
+class HariSiklus:
+    __slots__ = ("pos", "tri", "catur", "panca", "sad", "sapta", "asta", "sanga", "dasa",
+                 "total_urip", "weton", "wuku", "ingkel", "sasih", "status_bulan",
+                 "is_purnama", "is_tilem")
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def __repr__(self):
+        return f"HariSiklus(pos={self.pos}, sapta={self.sapta}, panca={self.panca}, wuku={self.wuku})"
+
+
+class KaTikaSiklus:
+    PERIODE = 2520
+    URIP_PANCA = [9, 7, 4, 8, 5]
+    URIP_SAPTA = [5, 4, 3, 7, 8, 6, 9]
+    STATUS_BULAN = ["PURNAMA", "TILEM", "PENANGGAL", "PANGLONG"]
+
+    def __init__(self):
+        # Struct-of-arrays: satu array int8 per field, diindeks dengan signal % 2520
+        s = np.arange(self.PERIODE, dtype=np.int64)
+        panca_idx, sapta_idx = s % 5, s % 7
+        urip = np.asarray(self.URIP_SAPTA)[sapta_idx] + np.asarray(self.URIP_PANCA)[panca_idx]
+        wuku_idx = (s // 7) % 30
+
+        cycle_pos = s % 420
+        sasih_idx = cycle_pos // 35
+        day_sasih = (cycle_pos % 35) + 1
+        is_edge = (day_sasih == 1) | (day_sasih == 35)
+        is_mid = day_sasih == 18
+        genap = (sasih_idx % 2) == 0
+        # Logika Custom Gelap/Terang: index genap -> Purnama di hari 18, ganjil -> di hari 1/35
+        is_purnama = np.where(genap, is_mid, is_edge)
+        is_tilem = np.where(genap, is_edge, is_mid)
+        awal = (day_sasih > 1) & (day_sasih < 18)
+        status_idx = np.where(is_purnama, 0, np.where(is_tilem, 1, np.where(awal == genap, 2, 3)))
+
+        fields = {
+            "tri": s % 4, "catur": s % 4, "panca": panca_idx, "sad": s % 6,
+            "sapta": sapta_idx, "asta": s % 8, "sanga": s % 9, "dasa": (urip + 1) % 10,
+            "total_urip": urip, "weton": sapta_idx * 5 + panca_idx,
+            "wuku": wuku_idx, "ingkel": wuku_idx % 6,
+            "sasih": sasih_idx, "status_bulan": status_idx,
+        }
+        self.arrays = {k: v.astype(np.int8) for k, v in fields.items()}
+        self.arrays["is_purnama"] = is_purnama
+        self.arrays["is_tilem"] = is_tilem
+        for arr in self.arrays.values():
+            arr.setflags(write=False)
+
+        cols = [self.arrays[name].tolist() for name in HariSiklus.__slots__[1:]]
+        self.records = [HariSiklus(pos, *row) for pos, row in enumerate(zip(*cols))]
+
+    def hari(self, signal: int) -> HariSiklus:
+        return self.records[signal % self.PERIODE]
+
+    def gather(self, signals) -> dict:
+        pos = np.asarray(signals, dtype=np.int64) % self.PERIODE
+        return {k: v[pos] for k, v in self.arrays.items()}
+
+
+SIKLUS = KaTikaSiklus()
@@ -0,0 +1,314 @@
+# ==========================================
+# 1. MODUL JANTUNG (PULSE)
+# ==========================================
+# Cache sunrise/sunset per (lokasi, tanggal lokal).
+# Lapisan 1: LRU di memori. Lapisan 2 (opsional): tabel di disk berisi epoch detik
+# [sunrise, sunset] per hari (.npy memory-mapped + metadata .json), dibangun sekali
+# dengan `prebuild` lalu dipasang dengan `attach`.
+import os
+import json
+import functools
+import threading
+from collections import OrderedDict, namedtuple
+from datetime import datetime, date, timedelta
+import pytz
+import numpy as np
+from .profiler import diukur
+
+
+class KaTikaSuryaCache:
+
+    def __init__(self, maxsize: int = 16384):
+        self.maxsize = maxsize
+        self._lru = OrderedDict()
+        self._tables = {}
+        self._lock = threading.Lock()
+        self.hits, self.misses = 0, 0
+
+    @staticmethod
+    def location_key(location) -> tuple:
+        return (round(location.latitude, 4), round(location.longitude, 4))
+
+    def get(self, location, day: date, tz, compute, backend: str = "astral") -> tuple:
+        loc_key = self.location_key(location) + (backend,)
+        key = (loc_key, day.toordinal())
+        with self._lock:
+            pair = self._lru.get(key)
+            if pair is not None:
+                self._lru.move_to_end(key)
+                self.hits += 1
+        if pair is None:
+            pair = self._from_table(loc_key, key[1])
+            if pair is None:
+                self.misses += 1
+                sunrise, sunset = compute(day)
+                pair = (sunrise.timestamp(), sunset.timestamp())
+            with self._lock:
+                self._lru[key] = pair
+                if len(self._lru) > self.maxsize:
+                    self._lru.popitem(last=False)
+        return datetime.fromtimestamp(pair[0], tz), datetime.fromtimestamp(pair[1], tz)
+
+    def _from_table(self, loc_key, ordinal):
+        table = self._tables.get(loc_key)
+        if table is None: return None
+        start, arr = table
+        i = ordinal - start
+        if 0 <= i < len(arr) and not np.isnan(arr[i, 0]):
+            return float(arr[i, 0]), float(arr[i, 1])
+        return None
+
+    def attach(self, path: str):
+        with open(path + ".json") as f:
+            meta = json.load(f)
+        arr = np.load(path, mmap_mode="r")
+        loc_key = (meta["latitude"], meta["longitude"], meta.get("backend", "astral"))
+        self._tables[loc_key] = (date.fromisoformat(meta["start"]).toordinal(), arr)
+
+    def prebuild(self, path: str, location, tz, start_year: int, end_year: int, compute,
+                 compute_batch=None, backend: str = "astral"):
+        start, end = date(start_year, 1, 1), date(end_year, 12, 31)
+        n = (end - start).days + 1
+        arr = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=(n, 2))
+        if compute_batch is not None:
+            arr[:, 0], arr[:, 1] = compute_batch(np.arange(start.toordinal(), end.toordinal() + 1))
+        else:
+            for i in range(n):
+                sunrise, sunset = compute(start + timedelta(days=i))
+                arr[i] = (sunrise.timestamp(), sunset.timestamp())
+        arr.flush()
+        lat, lon = self.location_key(location)
+        with open(path + ".json", "w") as f:
+            json.dump({"latitude": lat, "longitude": lon, "start": start.isoformat(),
+                       "days": n, "timezone": str(tz), "backend": backend}, f)
+        self.attach(path)
+
+
+# Cache dibagi oleh semua instance KaTikaPulse (Streamlit membuat ulang modul tiap rerun)
+SURYA_CACHE = KaTikaSuryaCache()
+if os.environ.get("KATIKA_SURYA_TABLE"):
+    SURYA_CACHE.attach(os.environ["KATIKA_SURYA_TABLE"])
+
+
+# Backend NOAA (vektor): sunrise/sunset untuk array tanggal sekaligus, tanpa astral.
+# Rumus dari NOAA Solar Calculator, dengan dua iterasi pada waktu kejadian.
+class KaTikaSuryaNOAA:
+    ZENITH = 90.833  # radius piringan matahari + refraksi standar (sama seperti astral)
+
+    @staticmethod
+    def _posisi(jd):
+        t = (jd - 2451545.0) / 36525.0
+        l0 = np.radians((280.46646 + t * (36000.76983 + t * 0.0003032)) % 360)
+        m = np.radians(357.52911 + t * (35999.05029 - 0.0001537 * t))
+        e = 0.016708634 - t * (0.000042037 + 0.0000001267 * t)
+        c = (np.sin(m) * (1.914602 - t * (0.004817 + 0.000014 * t))
+             + np.sin(2 * m) * (0.019993 - 0.000101 * t) + np.sin(3 * m) * 0.000289)
+        omega = np.radians(125.04 - 1934.136 * t)
+        app_long = np.radians(np.degrees(l0) + c - 0.00569 - 0.00478 * np.sin(omega))
+        eps0 = 23 + (26 + (21.448 - t * (46.815 + t * (0.00059 - t * 0.001813))) / 60) / 60
+        eps = np.radians(eps0 + 0.00256 * np.cos(omega))
+        decl = np.arcsin(np.sin(eps) * np.sin(app_long))
+        y = np.tan(eps / 2) ** 2
+        eot = 4 * np.degrees(y * np.sin(2 * l0) - 2 * e * np.sin(m) + 4 * e * y * np.sin(m) * np.cos(2 * l0)
+                             - 0.5 * y * y * np.sin(4 * l0) - 1.25 * e * e * np.sin(2 * m))
+        return decl, eot
+
+    def _kejadian(self, jd0, lat, lon, arah):
+        # arah -1 = sunrise, +1 = sunset; hasil dalam menit UTC sejak 00:00 UTC tanggal tsb
+        menit = 720 - 4 * lon + np.zeros_like(jd0)
+        for _ in range(2):
+            decl, eot = self._posisi(jd0 + menit / 1440.0)
+            cos_ha = (np.cos(np.radians(self.ZENITH)) / (np.cos(lat) * np.cos(decl))
+                      - np.tan(lat) * np.tan(decl))
+            ha = np.degrees(np.arccos(np.where(np.abs(cos_ha) <= 1, cos_ha, np.nan)))
+            menit = 720 - 4 * (lon - arah * ha) - eot
+        return menit
+
+    def hitung(self, ordinals, latitude: float, longitude: float) -> tuple:
+        # ordinals: date.toordinal() tanggal lokal; hasil: epoch detik (sunrise, sunset)
+        ordinals = np.asarray(ordinals, dtype=np.float64)
+        jd0 = ordinals + 1721424.5
+        lat = np.radians(latitude)
+        epoch0 = (jd0 - 2440587.5) * 86400.0
+        sunrise = epoch0 + self._kejadian(jd0, lat, longitude, -1) * 60.0
+        sunset = epoch0 + self._kejadian(jd0, lat, longitude, 1) * 60.0
+        return sunrise, sunset
+
+
+# Registry lokasi: nama -> Lokasi (field sama dengan astral.LocationInfo, tanpa import astral).
+# Scanner juga menerima LocationInfo langsung atau (lat, lon[, timezone]) untuk lokasi
+# yang tidak terdaftar.
+Lokasi = namedtuple("Lokasi", ["name", "region", "timezone", "latitude", "longitude"])
+
+LOKASI = {
+    # Bali
+    "Denpasar": Lokasi("Denpasar", "Bali", "Asia/Makassar", -8.6705, 115.2126),
+    "Singaraja": Lokasi("Singaraja", "Bali", "Asia/Makassar", -8.1120, 115.0882),
+    "Tabanan": Lokasi("Tabanan", "Bali", "Asia/Makassar", -8.5402, 115.1251),
+    "Gianyar": Lokasi("Gianyar", "Bali", "Asia/Makassar", -8.5410, 115.3253),
+    "Bangli": Lokasi("Bangli", "Bali", "Asia/Makassar", -8.4542, 115.3549),
+    "Semarapura": Lokasi("Semarapura", "Bali", "Asia/Makassar", -8.5350, 115.4036),
+    "Amlapura": Lokasi("Amlapura", "Bali", "Asia/Makassar", -8.4486, 115.6067),
+    "Negara": Lokasi("Negara", "Bali", "Asia/Makassar", -8.3569, 114.6180),
+    # Lombok
+    "Mataram": Lokasi("Mataram", "NTB", "Asia/Makassar", -8.5833, 116.1167),
+    "Selong": Lokasi("Selong", "NTB", "Asia/Makassar", -8.6500, 116.5333),
+    # Luar Bali
+    "Surabaya": Lokasi("Surabaya", "Jawa Timur", "Asia/Jakarta", -7.2575, 112.7521),
+    "Jakarta": Lokasi("Jakarta", "DKI Jakarta", "Asia/Jakarta", -6.2088, 106.8456),
+}
+LOKASI_DEFAULT = "Denpasar"
+
+
+def daftar_lokasi(nama: str, latitude: float, longitude: float, timezone: str = "Asia/Makassar",
+                  region: str = "") -> Lokasi:
+    LOKASI[nama] = Lokasi(nama, region, timezone, latitude, longitude)
+    return LOKASI[nama]
+
+
+def get_lokasi(lokasi=None) -> Lokasi:
+    if lokasi is None:
+        return LOKASI[LOKASI_DEFAULT]
+    if hasattr(lokasi, "latitude"):
+        return lokasi
+    if isinstance(lokasi, str):
+        if lokasi not in LOKASI:
+            raise KeyError(f"Lokasi tidak terdaftar: {lokasi!r} (pilih {sorted(LOKASI)})")
+        return LOKASI[lokasi]
+    lat, lon, *tz = lokasi
+    return Lokasi(f"{lat:.4f},{lon:.4f}", "", tz[0] if tz else "Asia/Makassar", lat, lon)
+
+
+# Epoch detik -> waktu lokal (DatetimeIndex tz-aware, dibulatkan ke detik). Di luar rentang
+# datetime64[ns] (~1677..2262, mis. tahun 2 M) dipakai resolusi detik, yang mencakup
+# seluruh rentang date Python (Gregorian proleptik).
+BATAS_NS = 9.2e9
+
+
+def waktu_lokal(epoch, tz):
+    import pandas as pd
+    epoch = np.asarray(epoch, dtype=np.float64)
+    kosong = np.isnan(epoch)
+    if not np.any(np.abs(epoch[~kosong]) >= BATAS_NS):
+        return pd.to_datetime(epoch, unit="s", utc=True).tz_convert(str(tz)).round("s")
+    detik = np.round(np.where(kosong, 0, epoch)).astype(np.int64).astype("datetime64[s]")
+    detik[kosong] = np.datetime64("NaT")
+    return pd.DatetimeIndex(detik).tz_localize("UTC").tz_convert(str(tz))
+
+
+class KaTikaPulse:
+    BACKENDS = ("astral", "noaa")
+    # Instance per (lokasi, backend) dibagi semua request; cache matahari tetap SURYA_CACHE
+    _PER_LOKASI = {}
+    _PER_LOKASI_LOCK = threading.Lock()
+
+    def __init__(self, sun_cache: KaTikaSuryaCache = None, backend: str = "astral", location=None):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Backend matahari tidak dikenal: {backend!r} (pilih {self.BACKENDS})")
+        # Lokasi default: Denpasar, Bali (lihat LOKASI)
+        self.location = get_lokasi(location)
+        self.timezone = pytz.timezone(self.location.timezone)
+        # Anchor Date: 19 Juli 2020 (Titik Nol)
+        self.anchor_date = date(2020, 7, 19)
+        self.sun_cache = sun_cache if sun_cache is not None else SURYA_CACHE
+        self.backend = backend
+        self.noaa = KaTikaSuryaNOAA()
+
+    @functools.cached_property
+    def observer(self):
+        from astral import Observer
+        return Observer(self.location.latitude, self.location.longitude)
+
+    def untuk(self, lokasi=None) -> "KaTikaPulse":
+        # Pulse untuk lokasi lain dengan backend & cache yang sama (None = lokasi ini)
+        if lokasi is None:
+            return self
+        location = get_lokasi(lokasi)
+        loc_key = KaTikaSuryaCache.location_key(location)
+        if loc_key == KaTikaSuryaCache.location_key(self.location) and location.timezone == self.location.timezone:
+            return self
+        key = (loc_key, location.timezone, self.backend, id(self.sun_cache))
+        with self._PER_LOKASI_LOCK:
+            pulse = self._PER_LOKASI.get(key)
+            if pulse is None:
+                pulse = self._PER_LOKASI[key] = KaTikaPulse(self.sun_cache, self.backend, location)
+        return pulse
+
+    @diukur("pulse.hitung_matahari")
+    def _hitung_matahari(self, day: date) -> tuple:
+        if self.backend == "noaa":
+            sunrise, sunset = self.noaa.hitung([day.toordinal()], self.location.latitude, self.location.longitude)
+            return (datetime.fromtimestamp(float(sunrise[0]), self.timezone),
+                    datetime.fromtimestamp(float(sunset[0]), self.timezone))
+        from astral.sun import sun  # astral baru dimuat saat backend astral menghitung
+        s_data = sun(self.observer, date=day, tzinfo=self.timezone)
+        return s_data['sunrise'], s_data['sunset']
+
+    def _hitung_matahari_batch(self, ordinals) -> tuple:
+        return self.noaa.hitung(ordinals, self.location.latitude, self.location.longitude)
+
+    @diukur("pulse.get_matahari_batch")
+    def get_matahari_batch(self, ordinals) -> tuple:
+        # Sunrise/sunset (epoch detik) untuk array tanggal lokal: NOAA sekaligus, astral lewat cache
+        ordinals = np.asarray(ordinals, dtype=np.int64)
+        if self.backend == "noaa":
+            return self._hitung_matahari_batch(ordinals)
+        sunrise, sunset = np.empty(len(ordinals)), np.empty(len(ordinals))
+        for i, o in enumerate(ordinals.tolist()):
+            rise, sset = self.sun_cache.get(self.location, date.fromordinal(o), self.timezone,
+                                            self._hitung_matahari, self.backend)
+            sunrise[i], sunset[i] = rise.timestamp(), sset.timestamp()
+        return sunrise, sunset
+
+    def prebuild_sun_table(self, path: str, start_year: int, end_year: int):
+        batch = self._hitung_matahari_batch if self.backend == "noaa" else None
+        self.sun_cache.prebuild(path, self.location, self.timezone, start_year, end_year,
+                                self._hitung_matahari, compute_batch=batch, backend=self.backend)
+
+    def cek_akurasi_noaa(self, start_year: int = 1970, years: int = 100, step: int = 1) -> dict:
+        # Bandingkan backend NOAA dengan astral.sun.sun (selisih maksimum dalam detik)
+        start = date(start_year, 1, 1).toordinal()
+        end = date(start_year + years, 1, 1).toordinal()
+        ordinals = np.arange(start, end, step)
+        rise_n, set_n = self._hitung_matahari_batch(ordinals)
+        rise_a, set_a = np.empty(len(ordinals)), np.empty(len(ordinals))
+        from astral.sun import sun
+        for i, o in enumerate(ordinals.tolist()):
+            s_data = sun(self.observer, date=date.fromordinal(o), tzinfo=self.timezone)
+            rise_a[i], set_a[i] = s_data['sunrise'].timestamp(), s_data['sunset'].timestamp()
+        return {
+            "hari": len(ordinals),
+            "max_selisih_sunrise_detik": float(np.max(np.abs(rise_n - rise_a))),
+            "max_selisih_sunset_detik": float(np.max(np.abs(set_n - set_a))),
+        }
+
+    @diukur("pulse.get_heartbeat")
+    def get_heartbeat(self, check_time: datetime) -> dict:
+        # Normalisasi Timezone
+        if check_time.tzinfo is None:
+            check_time = self.timezone.localize(check_time)
+        else:
+            check_time = check_time.astimezone(self.timezone)
+
+        # Hitung Data Matahari (via cache)
+        sunrise, sunset = self.sun_cache.get(self.location, check_time.date(), self.timezone,
+                                             self._hitung_matahari, self.backend)
+        
+        # Hitung Signal Dasar
+        delta = check_time.date() - self.anchor_date
+        base_signal = delta.days
+        
+        # Logika Pergantian Dina (CRITICAL)
+        if check_time < sunrise:
+            final_signal = base_signal - 1
+            phase = "WENGI (Sebelum Fajar)"
+        else:
+            final_signal = base_signal
+            phase = "RAHINA" if check_time < sunset else "WENGI"
+            
+        return {
+            "signal": final_signal,
+            "sunrise": sunrise,
+            "sunset": sunset,
+            "phase": phase
+        }
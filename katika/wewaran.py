@@ -0,0 +1,114 @@
+# ==========================================
+# 2. MODUL WEWARAN (CUSTOM + WATAK)
+# ==========================================
+from .profiler import diukur
+from .siklus import SIKLUS, KaTikaSiklus
+
+
+class KaTikaWewaran:
+    def __init__(self):
+        # Tri Wara (Custom 4 Siklus: Ada 2 Pasah)
+        self.TRI_WARA = ['Kajeng', 'Pasah', 'Beteng', 'Pasah']
+        
+        self.CATUR_WARA = ['Sri', 'Laba', 'Jaya', 'Menala']
+        
+        # Panca Wara (Start Paing)
+        self.PANCA_WARA = ['Paing', 'Pon', 'Wage', 'Kliwon', 'Umanis']
+        self.URIP_PANCA = KaTikaSiklus.URIP_PANCA
+        
+        self.SAD_WARA = ['Tungleh', 'Aryang', 'Urukung', 'Paniron', 'Was', 'Maulu']
+        
+        self.SAPTA_WARA = ['Redite', 'Soma', 'Anggara', 'Buda', 'Wraspati', 'Sukra', 'Saniscara']
+        self.URIP_SAPTA = KaTikaSiklus.URIP_SAPTA
+        
+        self.ASTA_WARA = ['Sri', 'Indra', 'Guru', 'Yama', 'Ludra', 'Brahma', 'Kala', 'Uma']
+        self.SANGA_WARA = ['Dangu', 'Jangur', 'Gigis', 'Nohan', 'Ogan', 'Erangan', 'Urungan', 'Tulus', 'Dadi']
+        self.DASA_WARA = ['Pandita', 'Pati', 'Suka', 'Duka', 'Sri', 'Manuh', 'Manusa', 'Raja', 'Dewa', 'Raksasa']
+
+        # Database Lintang / Watak (Sample)
+        self.DATA_LINTANG = {
+            (0, 0): {"nama": "Kukus", "sifat": "Keras hati, cemburu, penyayang."},
+            (0, 4): {"nama": "Kala Sungsang", "sifat": "Pemberani, suka bicara, mudah tersinggung."},
+            (1, 1): {"nama": "Lembu", "sifat": "Pendiam, cerdas, setia."},
+            # ... (Tambahkan sisa kombinasi 35 weton di sini)
+        }
+        self.DEFAULT_WATAK = {"nama": "Belum Terdata", "sifat": "Data pustaka sedang dilengkapi."}
+
+    @diukur("wewaran.get_wewaran_lengkap")
+    def get_wewaran_lengkap(self, signal: int) -> dict:
+        h = SIKLUS.hari(signal)
+
+        # Ambil Watak
+        watak = self.DATA_LINTANG.get((h.sapta, h.panca), self.DEFAULT_WATAK)
+
+        return {
+            "tri": self.TRI_WARA[h.tri], "catur": self.CATUR_WARA[h.catur],
+            "panca": self.PANCA_WARA[h.panca], "sad": self.SAD_WARA[h.sad],
+            "sapta": self.SAPTA_WARA[h.sapta], "asta": self.ASTA_WARA[h.asta],
+            "sanga": self.SANGA_WARA[h.sanga], "dasa": self.DASA_WARA[h.dasa],
+            "total_urip": h.total_urip,
+            "lintang_nama": watak['nama'],
+            "lintang_sifat": watak['sifat']
+        }
+
+# ==========================================
+# 3. MODUL KALENDER (SSOT)
+# ==========================================
+class KaTikaCalendar:
+    def __init__(self):
+        self.WUKU = ["Sinta", "Landep", "Ukir", "Kulantir", "Tolu", "Gumbreg",
+                     "Wariga", "Warigadean", "Julungwangi", "Sungsang", "Dungulan", "Kuningan",
+                     "Langkir", "Medangsia", "Pujut", "Pahang", "Krulut", "Merakih",
+                     "Tambir", "Medangkungan", "Matal", "Uye", "Menail", "Prangbakat",
+                     "Bala", "Ugu", "Wayang", "Klawu", "Dukut", "Watugunung"]
+        self.INGKEL = ["Wong", "Sato", "Mina", "Manuk", "Taru", "Buku"]
+
+    @diukur("calendar.get_calendar")
+    def get_calendar(self, signal: int, wew_data: dict) -> dict:
+        h = SIKLUS.hari(signal)
+        wuku_idx = h.wuku
+        return {
+            "wuku_name": self.WUKU[wuku_idx],
+            "wuku_index": wuku_idx,
+            "ingkel_name": self.INGKEL[h.ingkel],
+            "full_label": f"{wew_data['sapta']} {wew_data['panca']} {self.WUKU[wuku_idx]}"
+        }
+
+# ==========================================
+# 4. MODUL SASIH (420 HARI)
+# ==========================================
+class KaTikaSasih:
+    def __init__(self):
+        self.SASIH = ["Kasa", "Karo", "Katiga", "Kapat", "Kalima", "Kanem",
+                      "Kapitu", "Kaulu", "Kasanga", "Kadasa", "Jyestha", "Sada"]
+    
+    @diukur("sasih.get_sasih_info")
+    def get_sasih_info(self, signal: int) -> dict:
+        # Status Gelap/Terang sudah diselesaikan di tabel siklus
+        h = SIKLUS.hari(signal)
+        return {
+            "sasih_name": self.SASIH[h.sasih],
+            "status_bulan": SIKLUS.STATUS_BULAN[h.status_bulan],
+            "is_purnama": h.is_purnama,
+            "is_tilem": h.is_tilem
+        }
+
+# Peta field tabel siklus -> daftar nama (dipakai rule engine, batch, odalan)
+def tabel_nama(wew, cal, sas) -> dict:
+    return {
+        "tri": wew.TRI_WARA, "catur": wew.CATUR_WARA, "panca": wew.PANCA_WARA, "sad": wew.SAD_WARA,
+        "sapta": wew.SAPTA_WARA, "asta": wew.ASTA_WARA, "sanga": wew.SANGA_WARA, "dasa": wew.DASA_WARA,
+        "wuku": cal.WUKU, "ingkel": cal.INGKEL, "sasih": sas.SASIH,
+        "status_bulan": SIKLUS.STATUS_BULAN,
+    }
+
+def indeks_nama(tabel: dict, field: str, values) -> list:
+    # Nama bisa muncul lebih dari sekali (Pasah di Tri Wara), jadi ambil semua indeksnya
+    if field not in tabel:
+        raise ValueError(f"Field tidak dikenal: {field!r}")
+    names = tabel[field]
+    idx = [i for i, n in enumerate(names) if n in values]
+    unknown = set(values) - set(names)
+    if unknown:
+        raise ValueError(f"Nilai {sorted(unknown)} tidak ada di {field}")
+    return idx
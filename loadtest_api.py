@@ -0,0 +1,112 @@
+# ==========================================
+# LOAD TEST API KA-TIKA
+# ==========================================
+# Klien asyncio (stdlib) dengan koneksi keep-alive paralel; mengukur throughput dan
+# latency (p50/p90/p99) per endpoint terhadap api_server.py yang sedang berjalan.
+#
+#   python loadtest_api.py --url http://127.0.0.1:8080 -c 50 -n 5000
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from urllib.parse import quote, urlsplit
+
+# Campuran request default: sebagian berulang (menguji cache/coalescing), sebagian acak
+SKENARIO = [
+    lambda: f"/hari?tanggal=2026-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}T05:30",
+    lambda: f"/weton?tanggal={random.randint(1950, 2020)}-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}",
+    lambda: "/dewasa-ayu?kategori=" + quote("Pernikahan (Wiwaha)"),
+    lambda: f"/dewasa-ayu?kategori={quote('Upacara (Yadnya)')}&start=2026-01-01&days={random.choice([365, 3650])}",
+    lambda: "/odalan",
+    lambda: (lambda y: f"/odalan?start={y}-01-01&end={y + 9}-12-31")(random.randint(2000, 2090)),
+    lambda: f"/rentang?start=2026-01-01&end=2026-{random.randint(1, 12):02d}-28",
+]
+
+
+async def _get(reader, writer, host, path) -> tuple:
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: keep-alive\r\n\r\n".encode())
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ")[1])
+    length = next(int(l.split(":", 1)[1]) for l in lines if l.lower().startswith("content-length"))
+    body = await reader.readexactly(length)
+    return status, body
+
+
+async def _worker(host, port, jobs: asyncio.Queue, hasil: list):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while True:
+            try:
+                path = jobs.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            t0 = time.perf_counter()
+            try:
+                status, _ = await _get(reader, writer, host, path)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                status = 0
+                writer.close()
+                reader, writer = await asyncio.open_connection(host, port)
+            hasil.append((path.split("?")[0], status, time.perf_counter() - t0))
+    finally:
+        writer.close()
+
+
+def _persen(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+async def run(url: str, concurrency: int, total: int, seed: int) -> dict:
+    random.seed(seed)
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+    jobs = asyncio.Queue()
+    for _ in range(total):
+        jobs.put_nowait(random.choice(SKENARIO)())
+    hasil = []
+    t0 = time.perf_counter()
+    await asyncio.gather(*(_worker(host, port, jobs, hasil) for _ in range(concurrency)))
+    durasi = time.perf_counter() - t0
+
+    per_path = {}
+    for path, status, lat in hasil:
+        per_path.setdefault(path, []).append((status, lat))
+    ringkasan = {"requests": len(hasil), "detik": durasi, "rps": len(hasil) / durasi, "endpoint": {}}
+    for path, rows in sorted(per_path.items()):
+        lat = [l * 1e3 for _, l in rows]
+        ringkasan["endpoint"][path] = {
+            "n": len(rows), "gagal": sum(1 for s, _ in rows if s != 200),
+            "p50_ms": _persen(lat, 0.5), "p90_ms": _persen(lat, 0.9), "p99_ms": _persen(lat, 0.99),
+            "mean_ms": statistics.fmean(lat),
+        }
+    return ringkasan
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test untuk api_server.py")
+    parser.add_argument("--url", default="http://127.0.0.1:8080")
+    parser.add_argument("-c", "--concurrency", type=int, default=20)
+    parser.add_argument("-n", "--requests", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="cetak hasil sebagai JSON")
+    args = parser.parse_args(argv)
+
+    r = asyncio.run(run(args.url, args.concurrency, args.requests, args.seed))
+    if args.json:
+        print(json.dumps(r, indent=2))
+        return
+    print(f"{r['requests']} request dalam {r['detik']:.2f} detik = {r['rps']:.0f} req/detik")
+    print(f"{'endpoint':<14}{'n':>7}{'gagal':>7}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}")
+    for path, e in r["endpoint"].items():
+        print(f"{path:<14}{e['n']:>7}{e['gagal']:>7}{e['p50_ms']:>10.2f}{e['p90_ms']:>10.2f}{e['p99_ms']:>10.2f}")
+    sys.exit(1 if any(e["gagal"] for e in r["endpoint"].values()) else 0)
+
+
+if __name__ == "__main__":
+    main()